@@ -55,6 +55,7 @@ to function properly. See accompanying documentation for setup requirements.
 """
 
 # Python standard library imports
+from collections import OrderedDict
 import itertools
 import os
 import sqlite3
@@ -67,6 +68,7 @@ from numpy import array, std
 import pandas as pd
 from pandas import DataFrame, concat, options, read_sql, set_option, to_datetime, to_numeric
 import geopandas as gpd
+from scipy.spatial import cKDTree
 import utm
 from sqlalchemy import create_engine
 
@@ -93,22 +95,419 @@ from matplotlib.lines import Line2D
 from matplotlib.patches import PathPatch, Polygon
 from matplotlib.text import Text
 from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 from matplotlib.ticker import FuncFormatter, ScalarFormatter
 from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # Third-party imports - Geospatial
+import shapely
 from shapely import wkt
 from shapely.geometry import Point, Polygon
-from shapely.ops import unary_union
 
 # Third-party imports - Other
 import regex as re
 
+# Third-party imports - Optional acceleration (numba is not required; numpy fallbacks are used without it)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE: bool = False
+
 # Local application imports
 from WellVisualizerBoardMatters import BoardMattersVisualizer
 from WellVisualizationUI import Ui_Dialog
 
 
+# Number of boards whose processed plat geometry drawTSRPlat keeps (least recently drawn evicted first)
+PLAT_CACHE_SIZE: int = 8
+
+# Compact section/township/range code, e.g. '01235S02WB' (see transformString)
+TSR_PATTERN = re.compile(r'(\d{2})(\d{2}S)(\d{2}W)([A-Z])')
+
+# Point count from which click lookups switch from a direct scan to a KD-tree (without numba)
+KDTREE_MIN_POINTS: int = 4096
+
+# Field polygon colors: the first field is drawn in FIELD_PALETTE_LEAD, the rest cycle through FIELD_PALETTE
+FIELD_PALETTE_LEAD: str = '#000000'
+FIELD_PALETTE: Tuple[str, ...] = ('#003f5c', '#2f4b7c', '#665191', '#a05195',
+                                  '#d45087', '#f95d6a', '#ff7c43', '#ffa600')
+
+# Well detail fields shown in the three well data tables (and the well_data_table_view data rows)
+WELL_TABLE_FIELDS_1: Tuple[str, ...] = ('WellID', 'WellName', 'SideTrack', 'CurrentWellStatus', 'CurrentWellType',
+                                        'APDReceivedDate', 'APDReturnDate', 'APDApprovedDate', 'APDExtDate',
+                                        'APDRescindDate', 'DrySpud', 'RotarySpud')
+WELL_TABLE_FIELDS_2: Tuple[str, ...] = ('WellStatusReport', 'WellTypeReport', 'FirstProdDate', 'WCRCompletionDate',
+                                        'TestDate', 'ProductionMethod', 'OilRate', 'GasRate', 'WaterRate', 'DST',
+                                        'DirSurveyRun', 'CompletionType')
+WELL_TABLE_FIELDS_3: Tuple[str, ...] = ('GasVolume', 'OilVolume', 'WellAge', 'Last Production (if Shut In)',
+                                        'Months Shut In', 'Operator', 'MD', 'TVD', 'Perforation MD',
+                                        'Perforation TVD', 'WorkType', 'Slant')
+
+# Bits of the packed well classification built by classifyWells; the age bin sits above the category bits
+WELL_CLASS_DRILLED: int = 1
+WELL_CLASS_PLANNED: int = 2
+WELL_CLASS_DRILLING: int = 4
+WELL_AGE_BIN_SHIFT: int = 3
+
+# Display headers for the third data section (WELL_TABLE_FIELDS_3 with friendlier names)
+WELL_TABLE_HEADERS_3: Tuple[str, ...] = ('GasVolume', 'OilVolume', 'WellAge', 'Recorded Last Production',
+                                         'Months Shut In (if applicable)', 'Operator', 'MD', 'TVD',
+                                         'Perforation MD', 'Perforation TVD', 'WorkType', 'Slant')
+
+
+def polygonCentroidsNP(coords: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Computes area centroids for many polygons stored in one flat coordinate array.
+
+    Args:
+        coords: (N, 2) array of x/y vertices for all polygons, concatenated
+        offsets: Start index of each polygon in coords followed by N (len = polygons + 1)
+
+    Returns:
+        np.ndarray: (polygons, 2) array of centroid x/y values
+
+    Notes:
+        - Uses the closed-form shoelace centroid; polygons are implicitly closed
+        - Degenerate (zero-area) polygons fall back to the vertex mean
+        - Vectorized numpy version used when numba is not installed
+    """
+    x: np.ndarray = coords[:, 0].astype(np.float64)
+    y: np.ndarray = coords[:, 1].astype(np.float64)
+    starts: np.ndarray = offsets[:-1]
+
+    # Index of the next vertex, wrapping each polygon's last vertex back to its first
+    next_idx: np.ndarray = np.arange(1, len(x) + 1)
+    next_idx[offsets[1:] - 1] = starts
+    x_next, y_next = x[next_idx], y[next_idx]
+
+    cross: np.ndarray = x * y_next - x_next * y
+    area: np.ndarray = np.add.reduceat(cross, starts) / 2.0
+    cx: np.ndarray = np.add.reduceat((x + x_next) * cross, starts)
+    cy: np.ndarray = np.add.reduceat((y + y_next) * cross, starts)
+
+    # Fall back to the vertex mean for degenerate polygons
+    sizes: np.ndarray = np.diff(offsets)
+    degenerate: np.ndarray = area == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        centroids: np.ndarray = np.column_stack((cx / (6.0 * area), cy / (6.0 * area)))
+    centroids[degenerate, 0] = np.add.reduceat(x, starts)[degenerate] / sizes[degenerate]
+    centroids[degenerate, 1] = np.add.reduceat(y, starts)[degenerate] / sizes[degenerate]
+    return centroids
+
+
+def polygonCentroidsLoop(coords: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Loop form of polygonCentroidsNP, compiled with numba when it is available.
+
+    Each polygon's shoelace sum is independent, so the outer loop runs over prange
+    and is spread across threads by numba's parallel backend.
+
+    Args:
+        coords: (N, 2) array of x/y vertices for all polygons, concatenated
+        offsets: Start index of each polygon in coords followed by N (len = polygons + 1)
+
+    Returns:
+        np.ndarray: (polygons, 2) array of centroid x/y values
+    """
+    n_polygons = len(offsets) - 1
+    out = np.empty((n_polygons, 2))
+    for k in prange(n_polygons):
+        start, stop = offsets[k], offsets[k + 1]
+        area = 0.0
+        cx = 0.0
+        cy = 0.0
+        sx = 0.0
+        sy = 0.0
+        for i in range(start, stop):
+            j = i + 1 if i + 1 < stop else start
+            x0, y0 = coords[i, 0], coords[i, 1]
+            x1, y1 = coords[j, 0], coords[j, 1]
+            cross = x0 * y1 - x1 * y0
+            area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+            sx += x0
+            sy += y0
+        if area == 0.0:
+            out[k, 0] = sx / (stop - start)
+            out[k, 1] = sy / (stop - start)
+        else:
+            out[k, 0] = cx / (3.0 * area)
+            out[k, 1] = cy / (3.0 * area)
+    return out
+
+
+# Use the compiled loop when numba is installed, otherwise the vectorized numpy version
+polygonCentroids: Callable[[np.ndarray, np.ndarray], np.ndarray] = (
+    njit(parallel=True, cache=True)(polygonCentroidsLoop) if NUMBA_AVAILABLE else polygonCentroidsNP)
+
+
+def nearestWithinNP(xs: np.ndarray, ys: np.ndarray, xq: float, yq: float, r2: float) -> int:
+    """
+    Finds the point nearest to (xq, yq) whose squared distance is below r2.
+
+    Args:
+        xs: x coordinates of the candidate points
+        ys: y coordinates of the candidate points
+        xq: Query x coordinate
+        yq: Query y coordinate
+        r2: Squared distance limit
+
+    Returns:
+        int: Index of the nearest point, or -1 if none lies within the limit
+    """
+    dx: np.ndarray = xs - xq
+    dy: np.ndarray = ys - yq
+    dist_sq: np.ndarray = dx * dx + dy * dy
+    candidates: np.ndarray = np.flatnonzero(dist_sq < r2)
+    if candidates.size == 0:
+        return -1
+    return int(candidates[dist_sq[candidates].argmin()])
+
+
+def nearestWithinLoop(xs: np.ndarray, ys: np.ndarray, xq: float, yq: float, r2: float) -> int:
+    """
+    Loop form of nearestWithinNP, compiled with numba when it is available.
+
+    Subtract, square and minimum are fused into one pass over the coordinates. The
+    loop stays serial: the running minimum is a cross-iteration dependency.
+
+    Args:
+        xs: x coordinates of the candidate points
+        ys: y coordinates of the candidate points
+        xq: Query x coordinate
+        yq: Query y coordinate
+        r2: Squared distance limit
+
+    Returns:
+        int: Index of the nearest point, or -1 if none lies within the limit
+    """
+    best_i = -1
+    best = r2
+    for i in range(xs.size):
+        dx = xs[i] - xq
+        dy = ys[i] - yq
+        d = dx * dx + dy * dy
+        if d < best:
+            best = d
+            best_i = i
+    return best_i
+
+
+# Use the compiled single-pass scan when numba is installed, otherwise the vectorized numpy version
+nearestWithin: Callable[[np.ndarray, np.ndarray, float, float, float], int] = (
+    njit(cache=True)(nearestWithinLoop) if NUMBA_AVAILABLE else nearestWithinNP)
+
+
+def classifyWellsNP(citing_codes: np.ndarray, status_codes: np.ndarray, well_age: np.ndarray,
+                    asdrilled: int, vertical: int, planned: int, drilling: int) -> np.ndarray:
+    """
+    Packs the drilled/planned/drilling flags and the age bin of every well into one byte.
+
+    Args:
+        citing_codes: CitingType categorical codes
+        status_codes: CurrentWellStatus categorical codes
+        well_age: Well ages in months (float32 or float64)
+        asdrilled: Code of 'asdrilled' in citing_codes (-2 if absent)
+        vertical: Code of 'vertical' in citing_codes (-2 if absent)
+        planned: Code of 'planned' in citing_codes (-2 if absent)
+        drilling: Code of 'Drilling' in status_codes (-2 if absent)
+
+    Returns:
+        np.ndarray: uint8 array holding the WELL_CLASS_* bits plus the age bin shifted by
+            WELL_AGE_BIN_SHIFT (0: <= 12, 1: <= 60, 2: <= 120, 3: <= 9999 months, 4: older or NaN)
+    """
+    age_bin: np.ndarray = np.digitize(well_age, [12, 60, 120, 9999], right=True).astype(np.uint8)
+    out: np.ndarray = age_bin << WELL_AGE_BIN_SHIFT
+    out |= np.where((citing_codes == asdrilled) | (citing_codes == vertical), WELL_CLASS_DRILLED, 0).astype(np.uint8)
+    out |= np.where((citing_codes == planned) | (citing_codes == vertical), WELL_CLASS_PLANNED, 0).astype(np.uint8)
+    out |= np.where(status_codes == drilling, WELL_CLASS_DRILLING, 0).astype(np.uint8)
+    return out
+
+
+def classifyWellsLoop(citing_codes: np.ndarray, status_codes: np.ndarray, well_age: np.ndarray,
+                      asdrilled: int, vertical: int, planned: int, drilling: int) -> np.ndarray:
+    """
+    Loop form of classifyWellsNP, compiled with numba when it is available.
+
+    All flags and the age bin come out of a single pass over the three columns, and
+    every well is independent, so the loop runs over prange.
+
+    Args:
+        citing_codes: CitingType categorical codes
+        status_codes: CurrentWellStatus categorical codes
+        well_age: Well ages in months (float32 or float64)
+        asdrilled: Code of 'asdrilled' in citing_codes (-2 if absent)
+        vertical: Code of 'vertical' in citing_codes (-2 if absent)
+        planned: Code of 'planned' in citing_codes (-2 if absent)
+        drilling: Code of 'Drilling' in status_codes (-2 if absent)
+
+    Returns:
+        np.ndarray: uint8 array with the same packing as classifyWellsNP
+    """
+    n = citing_codes.size
+    out = np.empty(n, dtype=np.uint8)
+    for i in prange(n):
+        age = well_age[i]
+        if age <= 12:
+            bits = 0
+        elif age <= 60:
+            bits = 1
+        elif age <= 120:
+            bits = 2
+        elif age <= 9999:
+            bits = 3
+        else:
+            bits = 4
+        bits <<= WELL_AGE_BIN_SHIFT
+        code = citing_codes[i]
+        if code == asdrilled or code == vertical:
+            bits |= WELL_CLASS_DRILLED
+        if code == planned or code == vertical:
+            bits |= WELL_CLASS_PLANNED
+        if status_codes[i] == drilling:
+            bits |= WELL_CLASS_DRILLING
+        out[i] = bits
+    return out
+
+
+# Use the compiled single-pass classifier when numba is installed, otherwise the vectorized numpy version
+classifyWells: Callable[..., np.ndarray] = (
+    njit(parallel=True, cache=True)(classifyWellsLoop) if NUMBA_AVAILABLE else classifyWellsNP)
+
+
+def plannedKeepNP(planned_codes: np.ndarray, drilled_codes: np.ndarray, n_codes: int,
+                  status_codes: np.ndarray, drilling: int) -> np.ndarray:
+    """
+    Flags planned rows whose well is neither drilled nor currently drilling.
+
+    Args:
+        planned_codes: Integer well codes of the planned rows
+        drilled_codes: Integer well codes of the drilled rows (same coding as planned_codes)
+        n_codes: Number of distinct well codes
+        status_codes: CurrentWellStatus categorical codes of the planned rows
+        drilling: Code of 'Drilling' in status_codes (-2 if absent)
+
+    Returns:
+        np.ndarray: Boolean keep mask over the planned rows
+    """
+    drilled: np.ndarray = np.zeros(n_codes, dtype=bool)
+    drilled[drilled_codes] = True
+    return ~drilled[planned_codes] & (status_codes != drilling)
+
+
+def plannedKeepLoop(planned_codes: np.ndarray, drilled_codes: np.ndarray, n_codes: int,
+                    status_codes: np.ndarray, drilling: int) -> np.ndarray:
+    """
+    Loop form of plannedKeepNP, compiled with numba when it is available.
+
+    The drilled wells are marked in a direct-address table, then every planned row is
+    tested independently, so that second loop runs over prange.
+
+    Args:
+        planned_codes: Integer well codes of the planned rows
+        drilled_codes: Integer well codes of the drilled rows (same coding as planned_codes)
+        n_codes: Number of distinct well codes
+        status_codes: CurrentWellStatus categorical codes of the planned rows
+        drilling: Code of 'Drilling' in status_codes (-2 if absent)
+
+    Returns:
+        np.ndarray: Boolean keep mask over the planned rows
+    """
+    drilled = np.zeros(n_codes, dtype=np.bool_)
+    for i in range(drilled_codes.size):
+        drilled[drilled_codes[i]] = True
+    out = np.empty(planned_codes.size, dtype=np.bool_)
+    for i in prange(planned_codes.size):
+        out[i] = not drilled[planned_codes[i]] and status_codes[i] != drilling
+    return out
+
+
+# Use the compiled filter when numba is installed, otherwise the vectorized numpy version
+plannedKeep: Callable[..., np.ndarray] = (
+    njit(parallel=True, cache=True)(plannedKeepLoop) if NUMBA_AVAILABLE else plannedKeepNP)
+
+
+def exteriorRingCoords(geoms: np.ndarray) -> List[np.ndarray]:
+    """
+    Extracts the exterior ring vertices of many polygons in one vectorized call.
+
+    Args:
+        geoms: Array of shapely Polygons
+
+    Returns:
+        List[np.ndarray]: One (n, 2) coordinate array per polygon, in input order,
+            suitable for LineCollection.set_segments
+    """
+    coords, owner = shapely.get_coordinates(shapely.get_exterior_ring(geoms), return_index=True)
+    return np.split(coords, np.cumsum(np.bincount(owner, minlength=len(geoms)))[:-1])
+
+
+def tableColumnStrings(df: pd.DataFrame) -> List[np.ndarray]:
+    """
+    Converts every column of a DataFrame to display strings, one array per column.
+
+    Matches str(cell) on the values of df.values.tolist(): most columns are stringified
+    in one astype(str) pass, but datetime and timedelta columns are formatted through
+    their Timestamp/Timedelta objects, because astype(str) renders them differently
+    (e.g. dates without the ' 00:00:00' time part).
+
+    Args:
+        df: DataFrame to display
+
+    Returns:
+        List[np.ndarray]: One array of strings per column, in column order
+    """
+    columns: List[np.ndarray] = []
+    for j in range(df.shape[1]):
+        col: pd.Series = df.iloc[:, j]
+        if pd.api.types.is_datetime64_any_dtype(col) or pd.api.types.is_timedelta64_dtype(col):
+            columns.append(np.array([str(value) for value in col.astype(object)], dtype=object))
+        else:
+            columns.append(col.astype(str).to_numpy(copy=False))
+    return columns
+
+
+def transformString(s: str) -> str:
+    """
+    Transforms a section/township/range code from compact format to readable format.
+
+    Converts strings like '01235S02WB' to '1 23S 2W B' by removing leading zeros
+    and adding spaces between the section, township, range and baseline parts.
+
+    Args:
+        s: Input string in format 'SSTTDRRDB' where:
+           SS = Section (2 digits)
+           TT = Township (2 digits) followed by S
+           RR = Range (2 digits) followed by W
+           B = Baseline identifier
+
+    Returns:
+        str: Formatted string, or the original string if it doesn't match TSR_PATTERN
+
+    Examples:
+        >>> transformString('01235S02WB')
+        '1 23S 2W B'
+        >>> transformString('invalid')
+        'invalid'
+    """
+    # Parse string using the precompiled location pattern
+    parts = TSR_PATTERN.match(s)
+    if not parts:
+        return s  # Return unchanged if pattern doesn't match
+
+    # Extract and format components, removing leading zeros
+    part1 = str(int(parts.group(1)))  # Section number
+    part2 = str(int(parts.group(2)[:-1])) + parts.group(2)[-1]  # Township
+    part3 = str(int(parts.group(3)[:-1])) + parts.group(3)[-1]  # Range
+    part4 = parts.group(4)  # Baseline
+
+    # Return formatted string with proper spacing
+    return f"{part1} {part2} {part3} {part4}"
+
+
 """Function and class designed for creating bold values in the self.ui.well_lst_combobox, specifically bolding wells of importance."""
 
 
@@ -223,6 +622,30 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         set_option('display.max_columns', None)
         options.mode.chained_assignment = None
         self.combo_box_data = None
+        self._last_bold_key = None
+        self._last_status_counts = None
+        self._lines_by_api = {}
+        self._dx_df_groups = {}
+        self._last_drawn_well = None
+        self._last_targeted_elevation = None
+        self._targeted_elevation = np.empty(0, dtype=np.float64)
+        self._dx_data_by_ymd = {}
+        self._well_view_items = []
+        self._textpath_cache = {}
+        self._plat_cache = OrderedDict()
+        self._last_drawn_board = None
+        self._plat_data_dirty = True
+        self._adjacent_by_board = {}
+        self._plat_by_board = {}
+        self._wells_x = np.empty(0, dtype=np.float32)
+        self._wells_y = np.empty(0, dtype=np.float32)
+        self._wells_origin = (0.0, 0.0)
+        self._wells_api = np.empty(0, dtype=object)
+        self._kdtree = None
+        self._combo_box_index = {}
+        self._displayname_to_idx = {}
+        self._last_fields_key = None
+        self._fields_cache = None
         self.docket_ownership_data = None
         self.used_plat_codes = None
         self.df_adjacent_plats = None
@@ -333,8 +756,8 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.canvas_plat = FigureCanvas(self.figure_plat)
         self.ax_plat = self.figure_plat.subplots()
         self.targeted_well_elevation = 0
-        self.selected_well_2d_path = []
-        self.selected_well_3d_path = []
+        self.selected_well_2d_path = np.empty((0, 2))
+        self.selected_well_3d_path = np.empty((0, 3))
         self.targeted_well = "00000000000"
         self.scale_factor = 1
         self.line_prod_1, self.line_prod_2, self.line_prod_1_cum, self.line_prod_2_cum = None, None, None, None
@@ -634,6 +1057,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - self.ui.well_data_table_2
             - self.ui.well_data_table_3
             - self.ui.board_data_table
+            - self.ui.well_data_table_view (header modes/visibility, model and delegate)
 
         Note:
             This method should be called once during UI initialization before
@@ -655,11 +1079,28 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                 empty_item = QTableWidgetItem()  # Create empty cell
                 table.setItem(0, column, empty_item)  # Set cell in first row
 
+        # Keep handles to the cells so per-click updates are plain setText calls
+        self._wdt1_items: List[QTableWidgetItem] = [self.ui.well_data_table_1.item(0, i) for i in range(12)]
+        self._wdt2_items: List[QTableWidgetItem] = [self.ui.well_data_table_2.item(0, i) for i in range(12)]
+        self._wdt3_items: List[QTableWidgetItem] = [self.ui.well_data_table_3.item(0, i) for i in range(12)]
+
         # Initialize board data table (1 column x 3 rows)
         for row in range(3):  # Create empty cells down first column
             empty_item = QTableWidgetItem()  # Create empty cell
             self.ui.board_data_table.setItem(row, 0, empty_item)  # Set cell in first column
 
+        # Configure the well detail view once; sizes are fitted explicitly after each fill
+        # instead of ResizeToContents re-measuring on every cell change
+        self.ui.well_data_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.ui.well_data_table_view.verticalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.ui.well_data_table_view.horizontalHeader().setVisible(False)
+        self.ui.well_data_table_view.verticalHeader().setVisible(False)
+        self.ui.well_data_table_view.setModel(self.specific_well_data_model)
+
+        # Bold the header rows (0, 2, 4) of the well detail view
+        self._well_view_delegate = MultiBoldRowDelegate([0, 2, 4])
+        self.ui.well_data_table_view.setItemDelegate(self._well_view_delegate)
+
     def zoom(self, event: MouseEvent, ax: plt.Axes, centroid: Tuple[float, float, float], fig: Figure) -> None:
         """Performs zooming operations on a 3D plot using mouse scroll events.
 
@@ -941,10 +1382,33 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         selected year, month, and board docket.
 
         The filtered data is stored in self.df_docket for further processing.
+
+        Notes:
+            - The three comparisons are evaluated as a single compound query so only
+              one boolean mask is allocated; pandas uses numexpr for this automatically
+              when it is installed and falls back to plain Python evaluation otherwise
+        """
+        year: str = self.ui.year_lst_combobox.currentText()
+        month: str = self.ui.month_lst_combobox.currentText()
+        docket: str = self.ui.board_matter_lst_combobox.currentText()
+        self.df_docket = self.dx_data.query(
+            "Board_Year == @year and Docket_Month == @month and Board_Docket == @docket")
+
+        self.indexDocketDisplayNames()
+
+    def indexDocketDisplayNames(self) -> None:
+        """
+        Rebuilds the DisplayName -> row position map for the current self.df_docket.
+
+        The positions are only valid for the frame they were built from, so this must run
+        after every reassignment of self.df_docket (filterMainDataForDocket and the
+        directional survey filters).
+
+        Side Effects:
+            - Replaces self._displayname_to_idx
         """
-        self.df_docket = self.dx_data[(self.dx_data['Board_Year'] == self.ui.year_lst_combobox.currentText()) &
-            (self.dx_data['Docket_Month'] == self.ui.month_lst_combobox.currentText()) &
-            (self.dx_data['Board_Docket'] == self.ui.board_matter_lst_combobox.currentText())]
+        # Positional row indices per DisplayName, so table fills and well lookups can gather rows by take
+        self._displayname_to_idx: Dict[str, np.ndarray] = self.df_docket.groupby('DisplayName', sort=False).indices
 
     def updateOperatorsModel(self) -> None:
         """
@@ -1057,6 +1521,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
     def filterDocketForDirectionalSurveyData2(self):
         unique_apis_with_data = self.test_df['APINumber'].unique()
         self.df_docket = self.df_docket[self.df_docket['WellID'].isin(unique_apis_with_data)]
+        self.indexDocketDisplayNames()
 
     def filterDocketForDirectionalSurveyData(self) -> None:
         """
@@ -1082,6 +1547,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         Side Effects:
             - Modifies self.df_docket to contain only wells with directional survey data
+            - Rebuilds self._displayname_to_idx for the filtered frame
 
         Raises:
             AttributeError: If self.test_df or self.df_docket is not initialized
@@ -1090,8 +1556,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Get unique API numbers from wells with directional survey data
         unique_apis_with_data: Set[str] = self.test_df['APINumber'].unique()
 
-        # Filter docket to include only wells that have directional survey data
+        # Filter docket to include only wells that have directional survey data, then re-index the
+        # DisplayName row positions for the smaller frame
         self.df_docket = self.df_docket[self.df_docket['WellID'].isin(unique_apis_with_data)]
+        self.indexDocketDisplayNames()
 
     def createFinalSortedListOfWells(self) -> None:
         """
@@ -1208,6 +1676,12 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Extract and sort display names of main wells
         masters_apds: List[str] = sorted(self.df_docket[self.df_docket['MainWell'] == 1]['DisplayName'].unique())
 
+        # Skip the delegate install (and the view re-layout it triggers) when the master set is unchanged
+        key: Tuple[str, ...] = tuple(masters_apds)
+        if key == self._last_bold_key:
+            return
+        self._last_bold_key = key
+
         # Create delegate for bold formatting of main wells
         delegate: QStyledItemDelegate = BoldDelegate(masters_apds)
 
@@ -1336,13 +1810,11 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.owner_model.clear()
         self.agency_model.clear()
 
-        # Populate owner model with sorted owner names
-        for row in owners:
-            self.owner_model.appendRow(QStandardItem(row))
+        # Populate owner model with sorted owner names in a single batched insert
+        self.owner_model.invisibleRootItem().appendRows([QStandardItem(row) for row in owners])
 
-        # Populate agency model with sorted agency names
-        for row in agencies:
-            self.agency_model.appendRow(QStandardItem(row))
+        # Populate agency model with sorted agency names in a single batched insert
+        self.agency_model.invisibleRootItem().appendRows([QStandardItem(row) for row in agencies])
 
     def updateComboBoxData(self) -> None:
         """
@@ -1369,9 +1841,12 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Raises:
             AttributeError: If self.ui.well_lst_combobox is not initialized
         """
-        # Create list of truncated well names from combo box
-        self.combo_box_data: List[str] = [self.ui.well_lst_combobox.itemText(i)[:10]
-            for i in range(self.ui.well_lst_combobox.count())]
+        # Create list of truncated well names straight from the combo box's item model
+        model: QStandardItemModel = self.ui.well_lst_combobox.model()
+        self.combo_box_data: List[str] = [model.item(i).text()[:10] for i in range(model.rowCount())]
+
+        # Map each well identifier to its combo box position for O(1) selection lookups
+        self._combo_box_index: Dict[str, int] = {name: i for i, name in enumerate(self.combo_box_data)}
 
     def updateCountersForStatusAndType(self) -> None:
         """
@@ -1434,6 +1909,27 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.getCountersForStatus(main_statuses, other_statuses)
         self.getCountersForType(main_types, merged_types)
 
+    def _countCategoryCodes(self, column: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Counts every category of a categorical column with one bincount over its integer codes.
+
+        Args:
+            column: Categorical Series (e.g. CurrentWellStatus or CurrentWellType)
+
+        Returns:
+            Tuple containing:
+                - np.ndarray: Count per category, followed by a trailing zero
+                - pd.Index: The column's categories
+
+        Notes:
+            - Missing values (code -1) are excluded from the bincount
+            - The trailing zero lets get_indexer misses (-1) resolve to a count of 0
+        """
+        codes: np.ndarray = column.cat.codes.to_numpy()
+        categories: pd.Index = column.cat.categories
+        counts: np.ndarray = np.bincount(codes[codes >= 0], minlength=len(categories))
+        return np.append(counts, 0), categories
+
     def getCountersForType(self, main_types: List[str], merged_types: Dict[str, List[str]]) -> None:
         """
         Calculates and updates UI elements with well type counts from docket data.
@@ -1450,7 +1946,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Note:
             - Main types are counted directly from CurrentWellType column
             - Merged types aggregate counts from multiple related subtypes
-            - UI updates use f-strings for count display
+            - UI updates use %-formatting for count display
 
         Side Effects:
             - Updates multiple UI checkbox labels with count information
@@ -1458,26 +1954,21 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Raises:
             AttributeError: If df_docket or UI elements are not initialized
         """
-        # Initialize count dictionary for all well types
-        type_counts: Dict[str, int] = {well_type: 0 for well_type in main_types}
-        type_counts.update({merged: 0 for merged in merged_types})
-
-        # Count occurrences of main well types
-        for well_type in main_types:
-            type_counts[well_type] = self.df_docket['CurrentWellType'].value_counts().get(well_type, 0)
+        # Count every well type in a single bincount over the categorical codes
+        counts, categories = self._countCategoryCodes(self.df_docket['CurrentWellType'])
 
-        # Aggregate counts for merged type categories
-        for merged, subtypes in merged_types.items():
-            for subtype in subtypes:
-                type_counts[merged] += self.df_docket['CurrentWellType'].value_counts().get(subtype, 0)
+        # Gather main well types and aggregate merged type categories from the counts
+        type_counts: Dict[str, int] = dict(zip(main_types, counts[categories.get_indexer(main_types)].tolist()))
+        type_counts.update({merged: int(counts[categories.get_indexer(subtypes)].sum())
+            for merged, subtypes in merged_types.items()})
 
         # Update UI elements with calculated counts
-        self.ui.oil_well_check.setText(f"""Oil Well ({str(type_counts['Oil Well'])})""")
-        self.ui.gas_well_check.setText(f"""Gas Well ({str(type_counts['Gas Well'])})""")
-        self.ui.water_disposal_check.setText(f"""Water Disposal ({str(type_counts['Disposal Well'])})""")
-        self.ui.dry_hole_check.setText(f"""Dry Hole ({str(type_counts['Dry Hole'])})""")
-        self.ui.injection_check.setText(f"""Injection Well ({str(type_counts['Injection Well'])})""")
-        self.ui.other_well_status_check.setText(f"""Other ({str(type_counts['Other'])})""")
+        self.ui.oil_well_check.setText("Oil Well (%d)" % type_counts['Oil Well'])
+        self.ui.gas_well_check.setText("Gas Well (%d)" % type_counts['Gas Well'])
+        self.ui.water_disposal_check.setText("Water Disposal (%d)" % type_counts['Disposal Well'])
+        self.ui.dry_hole_check.setText("Dry Hole (%d)" % type_counts['Dry Hole'])
+        self.ui.injection_check.setText("Injection Well (%d)" % type_counts['Injection Well'])
+        self.ui.other_well_status_check.setText("Other (%d)" % type_counts['Other'])
 
     def getCountersForStatus(self, main_status: List[str], other_status: List[str]) -> None:
         """
@@ -1501,7 +1992,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             self.ui: PyQt5 UI object containing checkbox elements for status display
 
         Note:
-            - Uses pandas value_counts() for efficient counting
+            - Counts via np.bincount over the categorical codes of CurrentWellStatus
             - Handles missing statuses gracefully by defaulting to 0
             - Updates UI checkboxes with formatted count strings
             - Thread-safe for UI updates when used with PyQt5
@@ -1518,24 +2009,24 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             AttributeError: If df_docket or UI elements are not properly initialized
             KeyError: If 'CurrentWellStatus' column is missing from df_docket
         """
-        # Initialize counter dictionary with main statuses and 'Other' category
-        status_counts: Dict[str, int] = {status: 0 for status in main_status}
-        status_counts['Other'] = 0
+        # Count every well status in a single bincount over the categorical codes
+        counts, categories = self._countCategoryCodes(self.df_docket['CurrentWellStatus'])
 
-        # Count occurrences of main well statuses from docket data
-        for status in main_status:
-            status_counts[status] = self.df_docket['CurrentWellStatus'].value_counts().get(status, 0)
+        # Gather main statuses and sum the 'Other' category from the counts
+        status_counts: Dict[str, int] = dict(zip(main_status, counts[categories.get_indexer(main_status)].tolist()))
+        status_counts['Other'] = int(counts[categories.get_indexer(other_status)].sum())
 
-        # Aggregate counts for 'Other' category from secondary statuses
-        for status in other_status:
-            status_counts['Other'] += self.df_docket['CurrentWellStatus'].value_counts().get(status, 0)
+        # Skip the relabel (and the repaint it triggers) when the counts are unchanged
+        if self._last_status_counts == status_counts:
+            return
+        self._last_status_counts = dict(status_counts)
 
         # Update UI checkbox labels with formatted count information
-        self.ui.producing_check.setText(f"""Producing ({str(status_counts['Producing'])})""")
-        self.ui.shut_in_check.setText(f"""Shut In ({str(status_counts['Shut-in'])})""")
-        self.ui.pa_check.setText(f"""Plugged and Abandoned ({str(status_counts['Plugged & Abandoned'])})""")
-        self.ui.drilling_status_check.setText(f"""Drilling ({str(status_counts['Drilling'])})""")
-        self.ui.misc_well_type_check.setText(f"""Misc ({str(status_counts['Other'])})""")
+        self.ui.producing_check.setText("Producing (%d)" % status_counts['Producing'])
+        self.ui.shut_in_check.setText("Shut In (%d)" % status_counts['Shut-in'])
+        self.ui.pa_check.setText("Plugged and Abandoned (%d)" % status_counts['Plugged & Abandoned'])
+        self.ui.drilling_status_check.setText("Drilling (%d)" % status_counts['Drilling'])
+        self.ui.misc_well_type_check.setText("Misc (%d)" % status_counts['Other'])
 
     def colorInFields(self) -> None:
         """Processes and visualizes field sections with distinct colors on the map.
@@ -1557,40 +2048,6 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Raises:
             AttributeError: If required instance DataFrames are not initialized
         """
-        # Color list definition (truncated for brevity)
-        color_lst = [
-            '#000000', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600']
-
-        polygons_lst: List[np.ndarray] = []
-
         # Extract unique fields from docket data
         all_used_fields = self.df_docket['FieldName'].unique()
 
@@ -1598,30 +2055,33 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         used_fields = self.df_adjacent_fields[
             self.df_adjacent_fields['Field_Name'].isin(all_used_fields)]
 
-        # Combine original and adjacent field names
-        used_fields_names = list(set(used_fields['adjacent_Field_Name'].values.tolist() +
-            all_used_fields.tolist()))
+        # Combine original and adjacent field names (NaNs dropped so the sorted union can compare strings)
+        used_fields_names: np.ndarray = np.union1d(used_fields['adjacent_Field_Name'].dropna().to_numpy(),
+            all_used_fields[pd.notna(all_used_fields)])
 
         # Filter fields DataFrame for relevant fields
         used_fields = self.df_field[self.df_field['Field_Name'].isin(used_fields_names)]
 
-        # Process line segments and create field groups
-        used_fields['LineSegmentOrder'] = used_fields.groupby('Field_Name').cumcount() + 1
-        used_fields = used_fields.drop_duplicates(keep='first')
-        grouped_rows = used_fields.groupby('Field_Name')
+        # Group fields contiguously, preserving each field's vertex order (closing vertex included)
+        used_fields = used_fields.sort_values('Field_Name', kind='stable')
+
+        # Slice each field's polygon as a view into one coordinate array using group offsets
+        coords: np.ndarray = used_fields[['Easting', 'Northing']].to_numpy()
+        sizes: np.ndarray = used_fields.groupby('Field_Name', sort=False).size().to_numpy()
+        offsets: np.ndarray = np.concatenate(([0], sizes.cumsum()))
+        polygons_lst: List[np.ndarray] = [coords[offsets[k]:offsets[k + 1]] for k in range(len(sizes))]
 
-        # Create polygon coordinates for each field
-        for _, group in grouped_rows:
-            coordinates = group[['Easting', 'Northing']].values.tolist()
-            polygons_lst.append(np.array(coordinates))
+        # Lead with black, then cycle the field palette to exactly one color per polygon
+        color_lst: List[str] = [FIELD_PALETTE_LEAD] + list(
+            itertools.islice(itertools.cycle(FIELD_PALETTE), max(len(polygons_lst) - 1, 0)))
 
         # Update field section properties
         self.field_sections.set_color(color_lst)
         self.field_sections.set_paths(polygons_lst)
         self.field_sections.set_visible(False)
 
-        # Calculate and store field centroids and labels
-        self.field_centroids_lst = [Polygon(i).centroid for i in polygons_lst]
+        # Calculate and store field centroids (one x/y row per field) and labels
+        self.field_centroids_lst = polygonCentroids(coords.astype(np.float64), offsets)
         self.field_labels = used_fields['Field_Name'].unique()
 
     def fillInAllWellsTable(self, lst: List[str]) -> None:
@@ -1630,48 +2090,67 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Args:
             lst: List of DisplayNames to filter the wells data
 
-        This method filters the docket DataFrame based on provided display names,
-        sorts the data, and populates a QTableView with the results.
+        This method gathers the docket rows for the provided display names in list
+        order and populates a QTableView with the results.
 
         Instance Attributes Modified:
             df_all_wells_table: Updates filtered wells data
             all_wells_model: Updates table model with new data
 
         Note:
-            - Maintains display name ordering based on input list
+            - Maintains display name ordering based on input list; rows come from the
+              DisplayName row positions in self._displayname_to_idx (see indexDocketDisplayNames),
+              so no isin/categorical sort pass is needed
             - Automatically resizes table columns and rows
             - Hides vertical headers in the table view
 
         Raises:
             AttributeError: If required DataFrame or UI components are not initialized
         """
-        # Filter and sort wells data
-        self.df_all_wells_table = self.df_docket[self.df_docket['DisplayName'].isin(lst)]
-        self.df_all_wells_table['DisplayName'] = pd.Categorical(
-            self.df_all_wells_table['DisplayName'],
-            categories=lst, ordered=True)
-        self.df_all_wells_table.sort_values('DisplayName', inplace=True)
-        self.df_all_wells_table.reset_index(drop=True, inplace=True)
-
-        # Prepare table data
-        data = self.df_all_wells_table.values.tolist()
-        self.all_wells_model.removeRows(0, self.all_wells_model.rowCount())
-
-        # Set up table headers and populate data
-        self.all_wells_model.setHorizontalHeaderLabels(self.df_all_wells_table.columns)
-        for row in data:
-            items = [QStandardItem(str(item)) for item in row]
-            self.all_wells_model.appendRow(items)
-
-        # Configure table view properties
-        self.ui.all_wells_qtableview.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents)
-        self.ui.all_wells_qtableview.verticalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents)
-        self.ui.all_wells_qtableview.verticalHeader().setVisible(False)
-
-        # Set the model to the view
-        self.ui.all_wells_qtableview.setModel(self.all_wells_model)
+        # Gather the docket rows for each name in lst order (names repeated in lst are listed once)
+        idx: List[np.ndarray] = [self._displayname_to_idx[name] for name in dict.fromkeys(lst)
+            if name in self._displayname_to_idx]
+        positions: np.ndarray = np.concatenate(idx) if idx else np.empty(0, dtype=np.intp)
+        self.df_all_wells_table = self.df_docket.take(positions).reset_index(drop=True)
+
+        # Stringify each column once instead of boxing every cell through values.tolist()
+        str_cols: List[np.ndarray] = tableColumnStrings(self.df_all_wells_table)
+        row_count: int = len(self.df_all_wells_table)
+
+        # Keep the headers from re-measuring every row while the model is filled
+        self.ui.all_wells_qtableview.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.ui.all_wells_qtableview.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        # Preallocate the model and fill it cell by cell inside a model reset: the row/column count
+        # changes, so views must rebuild from modelReset (the per-cell insert signals are suppressed)
+        # (the try/finally blocks restore signals, the reset and view updates in reverse order if a fill fails)
+        model: QStandardItemModel = self.all_wells_model
+        self.ui.all_wells_qtableview.setUpdatesEnabled(False)
+        try:
+            model.beginResetModel()
+            model.blockSignals(True)
+            try:
+                model.setRowCount(row_count)
+                model.setColumnCount(len(str_cols))
+                model.setHorizontalHeaderLabels(self.df_all_wells_table.columns)
+                for j, col in enumerate(str_cols):
+                    for i in range(row_count):
+                        model.setItem(i, j, QStandardItem(col[i]))
+            finally:
+                model.blockSignals(False)
+                model.endResetModel()
+
+            # Configure table view properties
+            self.ui.all_wells_qtableview.horizontalHeader().setSectionResizeMode(
+                QHeaderView.ResizeToContents)
+            self.ui.all_wells_qtableview.verticalHeader().setSectionResizeMode(
+                QHeaderView.ResizeToContents)
+            self.ui.all_wells_qtableview.verticalHeader().setVisible(False)
+
+            # Set the model to the view
+            self.ui.all_wells_qtableview.setModel(self.all_wells_model)
+        finally:
+            self.ui.all_wells_qtableview.setUpdatesEnabled(True)
 
     def colorInOwnership(self) -> None:
         """Processes and visualizes land ownership data with color-coded polygons for both owners and agencies.
@@ -1698,10 +2177,6 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - self.ownership_sections_agency: PatchCollection for agency visualization
             - self.ownership_sections_owner: PatchCollection for owner visualization
         """
-        # Initialize empty lists for polygon coordinates
-        polygons_lst_owner: List[np.ndarray] = []
-        polygons_lst_agency: List[np.ndarray] = []
-
         # Define color mappings for different types of ownership
         colors_owner: Dict[str, str] = {'Private': '#D2B48C',
             'Tribal': '#800000',
@@ -1724,43 +2199,40 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             'Utah Department of Transportation': '#003f5c',
             'Tribal': '#800000'}
 
-        # Process ownership data and convert to GeoDataFrame
+        # Process ownership data, dropping duplicate rows before any geometry parsing or reprojection
         docket_ownership_data = self.df_owner[self.df_owner['conc'].isin(self.used_plat_codes_for_boards)]
-        docket_ownership_data['geometry'] = docket_ownership_data['geometry'].apply(wkt.loads)
+        docket_ownership_data = docket_ownership_data.drop_duplicates(keep='first')
+        docket_ownership_data['geometry'] = shapely.from_wkt(docket_ownership_data['geometry'].to_numpy())
         docket_ownership_data = gpd.GeoDataFrame(docket_ownership_data, geometry='geometry', crs='EPSG:4326')
 
         # Transform coordinate system to UTM Zone 12N (EPSG:26912)
         docket_ownership_data = docket_ownership_data.to_crs(epsg=26912)
 
-        # Map colors to ownership and agency data
-        docket_ownership_data['owner_color'] = docket_ownership_data['owner'].map(colors_owner)
-        docket_ownership_data['agency_color'] = docket_ownership_data['state_legend'].map(colors_agency)
-
-        # Create order columns for potential use in visualization
-        docket_ownership_data['owner_order'] = docket_ownership_data.groupby('owner').cumcount() + 1
-        docket_ownership_data['agency_order'] = docket_ownership_data.groupby('state_legend').cumcount() + 1
-
-        # Remove duplicates and store processed data
-        docket_ownership_data = docket_ownership_data.drop_duplicates(keep='first')
+        # Map colors to ownership and agency data by gathering from per-category lookup arrays
+        # (a trailing None catches missing values, whose categorical code is -1)
+        owners_cat: pd.Categorical = pd.Categorical(docket_ownership_data['owner'])
+        owner_color_lut: np.ndarray = np.array(
+            [colors_owner.get(c) for c in owners_cat.categories] + [None], dtype=object)
+        docket_ownership_data['owner_color'] = owner_color_lut[owners_cat.codes]
+
+        agencies_cat: pd.Categorical = pd.Categorical(docket_ownership_data['state_legend'])
+        agency_color_lut: np.ndarray = np.array(
+            [colors_agency.get(c) for c in agencies_cat.categories] + [None], dtype=object)
+        docket_ownership_data['agency_color'] = agency_color_lut[agencies_cat.codes]
         self.docket_ownership_data = docket_ownership_data
 
-        # Process geometries and colors for both owner and agency visualizations
-        colors_owner_used: List[str] = []
-        colors_agency_used: List[str] = []
-
-        # Create polygon collections for owners
-        for conc, group in docket_ownership_data.groupby('owner'):
-            for idx, row in group.iterrows():
-                coordinates = list(row['geometry'].exterior.coords)
-                polygons_lst_owner.append(np.array(coordinates))
-                colors_owner_used.append(row['owner_color'])
+        # Extract every polygon's exterior coordinates in one vectorized call and split them per polygon
+        exteriors: np.ndarray = shapely.get_exterior_ring(docket_ownership_data.geometry.to_numpy())
+        flat_coords, geom_index = shapely.get_coordinates(exteriors, return_index=True)
+        split_points: np.ndarray = np.bincount(geom_index, minlength=len(exteriors)).cumsum()[:-1]
+        coords: List[np.ndarray] = np.split(flat_coords, split_points)
 
-        # Create polygon collections for agencies
-        for conc, group in docket_ownership_data.groupby('state_legend'):
-            for idx, row in group.iterrows():
-                coordinates = list(row['geometry'].exterior.coords)
-                polygons_lst_agency.append(np.array(coordinates))
-                colors_agency_used.append(row['agency_color'])
+        # Both layers share the same polygons in row order; PatchCollection colors each path by index,
+        # so no grouping by owner or agency is needed
+        polygons_lst_owner: List[np.ndarray] = coords
+        polygons_lst_agency: List[np.ndarray] = coords
+        colors_owner_used: List[str] = docket_ownership_data['owner_color'].tolist()
+        colors_agency_used: List[str] = docket_ownership_data['agency_color'].tolist()
 
         # Update visualization properties for both agency and owner layers
         self.ownership_sections_agency.set_color(colors_agency_used)
@@ -1774,60 +2246,36 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.createOwnershipLabels()
 
     def colorInFields2(self):
-        # Here's a big list of distinctive colors,hopefully colorblind friendly.
-        color_lst = [
-            '#000000', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c',
-            '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191',
-            '#a05195', '#d45087', '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087',
-            '#f95d6a', '#ff7c43', '#ffa600', '#003f5c', '#2f4b7c', '#665191', '#a05195', '#d45087', '#f95d6a', '#ff7c43',
-            '#ffa600']
-        polygons_lst = []
         # Get a list of all fields out there that are used in these welkls
         all_used_fields = self.df_docket['FieldName'].unique()
 
-        # Get a list of adjacent fields to the fields that are being used
-        used_fields = self.df_adjacent_fields[self.df_adjacent_fields['Field_Name'].isin(all_used_fields)]
+        # same set of fields as last time: re-apply the cached paths/colors/labels and skip the rebuild
+        key = frozenset(all_used_fields.tolist())
+        if key == self._last_fields_key:
+            polygons_lst, color_lst, self.field_centroids_lst, self.field_labels = self._fields_cache
+            self.field_sections.set_color(color_lst)
+            self.field_sections.set_paths(polygons_lst)
+            self.field_sections.set_visible(False)
+            return
 
-        # get the names of all the adjacent fields and merge them with the original fields
-        used_fields_names = list(set(used_fields['adjacent_Field_Name'].values.tolist() + all_used_fields.tolist()))
+        # get the names of all the adjacent fields from the prebuilt adjacency map and merge them with the original fields
+        used_fields_names = list(set().union(*(self._adjacency_map.get(f, ()) for f in all_used_fields)) | set(all_used_fields))
 
-        # search df_fields for those fields specifically and generate a dataframe
-        used_fields = self.df_field[self.df_field['Field_Name'].isin(used_fields_names)]
+        # pull those fields from the name-sorted df_field index; rows come back already blocked by field
+        names = sorted(self.df_field_indexed.index.intersection(used_fields_names))
+        used_fields = self.df_field_indexed.loc[names].reset_index()
 
-        # group the fields linesegments, drop dupes, group by name
-        used_fields['LineSegmentOrder'] = used_fields.groupby('Field_Name').cumcount() + 1
-        used_fields = used_fields.drop_duplicates(keep='first')
-        grouped_rows = used_fields.groupby('Field_Name')
-        # Create a dictionary to store the polygons for each Conc and iterate them. There's probably a better way to do this
+        # split the coords wherever the field name changes
+        field_index = used_fields['Field_Name'].to_numpy()
+        coords = used_fields[['Easting', 'Northing']].to_numpy(dtype=np.float64)
+        boundaries = np.flatnonzero(field_index[1:] != field_index[:-1]) + 1
+        polygons_lst = np.split(coords, boundaries) if len(coords) else []
+        field_names = field_index[np.concatenate(([0], boundaries))] if len(coords) else field_index
+        codes_sorted = np.repeat(np.arange(len(polygons_lst)), [len(p) for p in polygons_lst])
 
-        for conc, group in grouped_rows:
-            # Extract the coordinates from the group
-            coordinates = group[['Easting', 'Northing']].values.tolist()
-            polygons_lst.append(np.array(coordinates))
+        # one color per polygon: black first, then cycle the shared field palette
+        color_lst = [FIELD_PALETTE_LEAD] + list(
+            itertools.islice(itertools.cycle(FIELD_PALETTE), max(len(polygons_lst) - 1, 0)))
 
         # set the colors, paths, and visibility. Initially it won't be visible.
         self.field_sections.set_color(color_lst)
@@ -1835,28 +2283,18 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.field_sections.set_visible(False)
 
         # get the centroids. These will be where the field name labels will be anchored.
-        self.field_centroids_lst = [Polygon(i).centroid for i in polygons_lst]
-        self.field_labels = used_fields['Field_Name'].unique()
+        # build every field polygon in one shapely call from the sorted coords and take all centroids at once
+        field_geoms = shapely.polygons(shapely.linearrings(coords, indices=codes_sorted))
+        self.field_centroids_lst = shapely.get_coordinates(shapely.centroid(field_geoms))
+        self.field_labels = np.asarray(field_names)
 
-    def fillInAllWellsTable2(self, lst):
-        self.df_all_wells_table = self.df_docket[self.df_docket['DisplayName'].isin(lst)]
-        self.df_all_wells_table['DisplayName'] = pd.Categorical(self.df_all_wells_table['DisplayName'], categories=lst, ordered=True)
-        self.df_all_wells_table.sort_values('DisplayName', inplace=True)
-        self.df_all_wells_table.reset_index(drop=True, inplace=True)
-        data = self.df_all_wells_table.values.tolist()
-        self.all_wells_model.removeRows(0, self.all_wells_model.rowCount())
-
-        self.all_wells_model.setHorizontalHeaderLabels(self.df_all_wells_table.columns)
-        for row in data:
-            items = [QStandardItem(str(item)) for item in row]
-            self.all_wells_model.appendRow(items)
-
-        # Set the model to the QTableView
-        self.ui.all_wells_qtableview.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.ui.all_wells_qtableview.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.ui.all_wells_qtableview.verticalHeader().setVisible(False)
+        # remember this result for the next docket that uses the same fields
+        self._last_fields_key = key
+        self._fields_cache = (polygons_lst, color_lst, self.field_centroids_lst, self.field_labels)
 
-        self.ui.all_wells_qtableview.setModel(self.all_wells_model)
+    def fillInAllWellsTable2(self, lst):
+        # same table fill as fillInAllWellsTable, which gathers rows through the DisplayName index
+        self.fillInAllWellsTable(lst)
 
     def onRowClicked(self, index: QModelIndex) -> None:
         """
@@ -1894,44 +2332,42 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         row_data: List[Any] = [self.all_wells_model.data(self.all_wells_model.index(row, column))
             for column in range(self.all_wells_model.columnCount())]
 
-        # Filter well data based on API Number and extract coordinates
-        filtered_df: pd.DataFrame = self.currently_used_lines[self.currently_used_lines['APINumber'] == row_data[0]]
-        data_select_2d: np.ndarray = filtered_df[['X', 'Y']].to_numpy().astype(float)
-        data_select_3d: np.ndarray = filtered_df[['SPX', 'SPY', 'Targeted Elevation']].to_numpy().astype(float)
+        # Look up the well's precomputed coordinates by API Number
+        well_coords: np.ndarray = self._lines_by_api.get(row_data[0], np.empty((0, 5)))
+        data_select_2d: np.ndarray = well_coords[:, :2]
+        data_select_3d: np.ndarray = well_coords[:, 2:5]
 
         # Update well path data
-        self.selected_well_2d_path: List[List[float]] = data_select_2d.tolist()
-        self.selected_well_3d_path: List[List[float]] = data_select_3d.tolist()
+        self.selected_well_2d_path: np.ndarray = data_select_2d
+        self.selected_well_3d_path: np.ndarray = data_select_3d
 
         # Update selected well and combo box selection
         self.targeted_well: str = row_data[0]
-        target_index: int = self.combo_box_data.index(self.targeted_well)
+        target_index: int = self._combo_box_index[self.targeted_well]
         self.ui.well_lst_combobox.setCurrentIndex(target_index)
 
-        # Define data categories for table population
-        row_1_data: List[str] = ['WellID', 'WellName', 'SideTrack', 'WorkType', 'Slant',
-            'APDReceivedDate', 'APDReturnDate', 'APDApprovedDate',
-            'APDExtDate', 'APDRescindDate', 'DrySpud', 'RotarySpud']
-        row_2_data: List[str] = ['WCRCompletionDate', 'WellStatusReport', 'WellTypeReport',
-            'FirstProdDate', 'TestDate', 'ProductionMethod', 'OilRate',
-            'GasRate', 'WaterRate', 'DST', 'DirSurveyRun', 'CompletionType']
-        row_3_data: List[str] = ['MD', 'TVD', 'Perforation MD', 'Perforation TVD',
-            'CurrentWellStatus', 'CurrentWellType', 'Total Gas Prod',
-            'Total Oil Prod', 'WellAge', 'Last Production (if Shut In)',
-            'Months Shut In']
-
-        # Create dictionary and DataFrame for data organization
-        all_columns: List[str] = row_1_data + row_2_data + row_3_data
-        result_dict: Dict[str, Any] = {col: value for col, value in zip(all_columns, row_data)}
-        test_df: pd.DataFrame = pd.DataFrame([result_dict])
-
-        # Populate the three data tables with well information
-        for i, value in enumerate(row_1_data):
-            self.ui.well_data_table_1.item(0, i).setText(str(test_df[value].item()))
-        for i, value in enumerate(row_2_data):
-            self.ui.well_data_table_2.item(0, i).setText(str(test_df[value].iloc[0]))
-        for i, value in enumerate(row_3_data):
-            self.ui.well_data_table_3.item(0, i).setText(str(test_df[value].iloc[0]))
+        # Model columns follow the three table layouts in order (12 + 12 + 11 values)
+        table_spans: Tuple[Tuple[List[QTableWidgetItem], int, int], ...] = (
+            (self._wdt1_items, 0, 12), (self._wdt2_items, 12, 24), (self._wdt3_items, 24, 35))
+
+        # Suspend repaints and signals so the cell updates collapse into one repaint per table
+        well_tables: Tuple[QTableWidget, ...] = (self.ui.well_data_table_1, self.ui.well_data_table_2,
+            self.ui.well_data_table_3)
+        for table in well_tables:
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+
+        # Populate the three data tables in one pass, slicing the row values per table (the tables are
+        # restored even if a cell update fails)
+        try:
+            for items, start, stop in table_spans:
+                for item, value in zip(items, row_data[start:stop]):
+                    item.setText(str(value))
+        finally:
+            for table in well_tables:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
+                table.viewport().update()
 
         # Update 2D visualization
         self.update2dSelectedWhenWellChanges()
@@ -1983,32 +2419,37 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             self.drawModelBasedOnParameters2d(self.all_wells_2d_operators[i],
                 [], [], [], self.ax2d, self.all_wells_2d_operators_vertical[i])
 
-        # Reset 3D specific well properties
+        # Reset 3D specific well properties; Line3D.draw projects from _verts3d, so setting it
+        # directly skips set_data/set_3d_properties validation for the empty case
+        empty: np.ndarray = np.empty(0, dtype=np.float64)
         for well_obj in [self.spec_well_3d, self.spec_well_3d_solo]:
-            well_obj.set_data([], [])
-            well_obj.set_3d_properties([])
+            well_obj._verts3d = (empty, empty, empty)
+            well_obj._invalidx = True
+            well_obj.stale = True
 
         # Clear 2D visualization components
         self.all_vertical_wells_2d.set_offsets([None, None])
         self.spec_vertical_wells_2d.set_offsets([None, None])
         self.spec_well_2d.set_data([], [])
+        self._last_drawn_well = None
 
         # Reset plat visualizations
         for plat_collection in [self.plats_2d, self.plats_2d_main, self.plats_2d_1adjacent, self.plats_2d_2adjacent]:
             plat_collection.set_segments([])
+        self._last_drawn_board = None
 
-        # Clear section and ownership visualizations
+        # Clear section and ownership visualizations (PolyCollections; skip the ring-closing pass)
         for section_collection in [self.ownership_sections_agency, self.ownership_sections_owner, self.field_sections, self.outlined_board_sections]:
-            section_collection.set_paths([])
+            section_collection.set_verts([], closed=False)
 
         # Reset production data visualizations
         for line in [self.profit_line, self.profit_line_cum, self.prod_line, self.prod_line_cum]:
             line.set_data([], [])
 
-        # Clear well data tables
-        self.specific_well_data_model.removeRows(
-            0, self.specific_well_data_model.rowCount()
-        )
+        # Clear well data tables (the detail view keeps its item grid for reuse)
+        for items in self._well_view_items:
+            for item in items:
+                item.setText('')
         for i in range(11):
             for table in [self.ui.well_data_table_1, self.ui.well_data_table_2, self.ui.well_data_table_3]:
                 table.item(0, i).setText('')
@@ -2018,14 +2459,9 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             text.remove()
         self.zp.text_objects = []
 
-        # Update all canvases
+        # Schedule a redraw of all canvases; draw_idle coalesces with the next real update
         for canvas in [self.canvas_prod_1, self.canvas_prod_2, self.canvas3d_solo, self.canvas2d, self.canvas3d]:
-            canvas.draw()
-
-        # Special handling for 2D canvas
-        self.ax2d.draw_artist(self.all_vertical_wells_2d)
-        self.canvas2d.blit(self.ax2d.bbox)
-        self.canvas3d.blit(self.ax3d.bbox)
+            canvas.draw_idle()
 
         # Reset well table and operators
         self.ui.all_wells_qtableview.setModel(None)
@@ -2048,16 +2484,18 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         for check_name, label in checkbox_labels.items():
             getattr(self.ui, check_name).setText(f"{label}")
 
+        # Labels no longer show counts, so the next status count must relabel
+        self._last_status_counts = None
+
     def setAxesLimits(self) -> None:
         """
         Sets the axes limits for the 2D visualization based on the data points' distribution.
 
         This method processes the docket data to determine appropriate axis limits that will
         properly display all data points with sufficient padding. The process involves:
-        1. Generating line segments from docket data
-        2. Extracting unique coordinate points
-        3. Calculating boundaries with padding
-        4. Setting axis limits with a 16000-unit buffer
+        1. Extracting all well coordinate points from docket data as one array
+        2. Calculating boundaries with padding
+        3. Setting axis limits with a 16000-unit buffer
 
         Args:
             self: The class instance containing required attributes:
@@ -2073,23 +2511,18 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Notes:
             - Adds a 16000-unit buffer on all sides to ensure visibility of edge points
             - Uses numpy operations for efficient array processing
+            - Points are not deduplicated; repeated points cannot change the min/max
             - Assumes all coordinate data is valid and numerical
 
         Example:
             >>> self.setAxesLimits()  # Adjusts axes based on current docket data
         """
-        # Generate all line segments from docket data
-        segments: List[List[Tuple[float, float]]] = self.returnSegmentsFromDF(self.df_docket_data)
-
-        # Convert segments to unique coordinate points
-        flattened_list: List[Tuple[float, float]] = [tuple(point) for sublist in segments for point in sublist]
-        unique_points: np.ndarray = np.array(list(set(flattened_list)))
+        # Get every well point from docket data as one flat coordinate array (duplicates don't affect min/max)
+        points, _ = self.returnSegmentArraysFromDF(self.df_docket_data)
 
         # Calculate boundary values from coordinate points
-        min_x: float = np.min(unique_points[:, 0])  # Minimum x coordinate
-        max_x: float = np.max(unique_points[:, 0])  # Maximum x coordinate
-        min_y: float = np.min(unique_points[:, 1])  # Minimum y coordinate
-        max_y: float = np.max(unique_points[:, 1])  # Maximum y coordinate
+        min_x, min_y = points.min(axis=0)  # Minimum x/y coordinates
+        max_x, max_y = points.max(axis=0)  # Maximum x/y coordinates
 
         # Set axis limits with padding
         self.ax2d.set_xlim([min_x - 16000, max_x + 16000])  # Add x-axis buffer
@@ -2100,8 +2533,8 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Handles mouse click events in the 2D well visualization to select and display well information.
 
         This method processes click events by:
-        1. Calculating the distance between the click location and all visible wells
-        2. Identifying the closest well within a dynamic threshold
+        1. Finding the visible well point nearest to the click (nearestWellPoint)
+        2. Accepting it only within a dynamic threshold
         3. Loading and displaying the selected well's data
         4. Updating the UI components to reflect the selection
 
@@ -2133,35 +2566,25 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             # Calculate dynamic selection threshold based on current view
             limit: float = (np.diff(self.ax2d.get_xlim())[0] + np.diff(self.ax2d.get_ylim())[0]) / 80
 
-            # Calculate distances to all visible wells
-            self.currently_used_lines['distance'] = np.sqrt(
-                (self.currently_used_lines['X'].astype(float) - x_selected) ** 2 +
-                (self.currently_used_lines['Y'].astype(float) - y_selected) ** 2)
-
-            # Filter wells within selection threshold
-            closest_points: pd.DataFrame = self.currently_used_lines[self.currently_used_lines['distance'] < limit]
-
-            if not closest_points.empty:
-                # Identify closest well
-                closest_point: pd.Series = closest_points.loc[closest_points['distance'].idxmin()]
+            # Find the nearest visible well point within the threshold (-1 when none)
+            point_index: int = self.nearestWellPoint(x_selected, y_selected, limit)
 
+            if point_index >= 0:
                 # Get API number of selected well
-                selected_well_api: str = closest_point['APINumber']
-
-                # Filter full well data
-                filtered_df: pd.DataFrame = self.currently_used_lines[self.currently_used_lines['APINumber'] == selected_well_api]
+                selected_well_api: str = self._wells_api[point_index]
 
-                # Extract 2D and 3D coordinate data
-                data_select_2d: np.ndarray = filtered_df[['X', 'Y']].to_numpy().astype(float)
-                data_select_3d: np.ndarray = filtered_df[['SPX', 'SPY', 'Targeted Elevation']].to_numpy().astype(float)
+                # Look up the well's precomputed 2D and 3D coordinate data
+                well_coords: np.ndarray = self._lines_by_api[selected_well_api]
+                data_select_2d: np.ndarray = well_coords[:, :2]
+                data_select_3d: np.ndarray = well_coords[:, 2:5]
 
                 # Update instance variables with selected well data
-                self.selected_well_2d_path: List[List[float]] = data_select_2d.tolist()
-                self.selected_well_3d_path: List[List[float]] = data_select_3d.tolist()
+                self.selected_well_2d_path: np.ndarray = data_select_2d
+                self.selected_well_3d_path: np.ndarray = data_select_3d
                 self.targeted_well: str = selected_well_api
 
                 # Update combo box selection
-                target_index: int = self.combo_box_data.index(self.targeted_well)
+                target_index: int = self._combo_box_index[self.targeted_well]
                 self.ui.well_lst_combobox.setCurrentIndex(target_index)
 
                 # Update well information display
@@ -2187,12 +2610,14 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - Updates self.selected_well_3d_path with new 3D coordinates
             - Updates self.targeted_well with current API number
             - Updates self.targeted_well_elevation
-            - Modifies dx_df and dx_data with new relative elevation calculations
+            - Modifies dx_df and dx_data with new relative elevation calculations when
+              the reference elevation differs from self._last_targeted_elevation
+            - Sets self._targeted_elevation: Targeted Elevation as a positional ndarray
 
         Notes:
             - API numbers are truncated to first 10 characters for filtering
             - Elevation calculations are based on the first entry in dx_data
-            - Coordinates are converted to float type for numerical operations
+            - X, Y and TrueVerticalDepth are stored as float64 by loadWellData
 
         Example:
             >>> self.update2dWhenDocketChanges()  # Updates visualization after well selection
@@ -2201,24 +2626,29 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         current_text: str = self.ui.well_lst_combobox.currentText()
         api_number: str = current_text[:10]  # First 10 chars represent API number
 
-        # Filter well data based on API number
-        filtered_df: pd.DataFrame = self.dx_df[self.dx_df['APINumber'] == api_number]
+        # Gather the well's rows from the cached APINumber row positions
+        filtered_df: pd.DataFrame = self.dx_df.take(self._dx_df_groups.get(api_number, np.empty(0, dtype=np.intp)))
 
-        # Extract and convert coordinate data
-        data_select_2d: np.ndarray = filtered_df[['X', 'Y']].to_numpy().astype(float)
-        data_select_3d: np.ndarray = filtered_df[['X', 'Y', 'TrueVerticalDepth']].to_numpy().astype(float)
+        # Extract coordinate data (columns are float64 since loadWellData)
+        data_select_2d: np.ndarray = filtered_df[['X', 'Y']].to_numpy(dtype=np.float64, copy=False)
+        data_select_3d: np.ndarray = filtered_df[['X', 'Y', 'TrueVerticalDepth']].to_numpy(dtype=np.float64, copy=False)
 
         # Update instance variables with new coordinate data
-        self.selected_well_2d_path: List[List[float]] = data_select_2d.tolist()
-        self.selected_well_3d_path: List[List[float]] = data_select_3d.tolist()
+        self.selected_well_2d_path: np.ndarray = data_select_2d
+        self.selected_well_3d_path: np.ndarray = data_select_3d
         self.targeted_well: str = api_number
 
         # Calculate relative elevation values
         self.targeted_well_elevation: float = self.dx_data['Elevation'].iloc[0]
 
-        # Update DataFrames with relative elevation calculations
-        self.dx_df['Targeted Elevation'] = (self.dx_df['TrueElevation'] - self.targeted_well_elevation)
-        self.dx_data['Relative Elevation'] = (self.dx_data['Elevation'] - self.targeted_well_elevation)
+        # Update DataFrames with relative elevation calculations only when the reference elevation changed
+        # (computed on the raw arrays; the selected-well draw reads self._targeted_elevation directly)
+        if self.targeted_well_elevation != self._last_targeted_elevation:
+            self._targeted_elevation: np.ndarray = (
+                self.dx_df['TrueElevation'].to_numpy(dtype=np.float64) - self.targeted_well_elevation)
+            self.dx_df['Targeted Elevation'] = self._targeted_elevation
+            self.dx_data['Relative Elevation'] = self.dx_data['Elevation'].to_numpy() - self.targeted_well_elevation
+            self._last_targeted_elevation = self.targeted_well_elevation
 
     def comboUpdateWhenWellChanges(self) -> None:
         """
@@ -2248,10 +2678,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Example:
             >>> self.comboUpdateWhenWellChanges()  # Updates UI after well selection change
         """
-        # Filter data frame based on current UI selections
-        df_month: pd.DataFrame = self.dx_data[(self.dx_data['Board_Year'] == self.ui.year_lst_combobox.currentText()) &
-            (self.dx_data['Docket_Month'] == self.ui.month_lst_combobox.currentText()) &
-            (self.dx_data['Board_Docket'] == self.ui.board_matter_lst_combobox.currentText())]
+        # Gather the rows for the current UI selections from the cached (year, month, docket) positions
+        ymd_key: Tuple[str, str, str] = (self.ui.year_lst_combobox.currentText(),
+            self.ui.month_lst_combobox.currentText(), self.ui.board_matter_lst_combobox.currentText())
+        df_month: pd.DataFrame = self.dx_data.take(self._dx_data_by_ymd.get(ymd_key, np.empty(0, dtype=np.intp)))
 
         # Get current well selection
         current_text: str = self.ui.well_lst_combobox.currentText()
@@ -2259,40 +2689,35 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Filter to current well's data
         current_data_row: pd.DataFrame = df_month[df_month['DisplayName'] == current_text]
 
-        # Handle multiple records by selecting most recent
+        # Handle multiple records by selecting most recent (a linear max instead of a full sort)
         if len(current_data_row) > 1:
-            current_data_row = current_data_row.sort_values(by='APDApprovedDate', ascending=False).head(1)
-
-        # Define data fields for each table
-        row_1_data: List[str] = ['WellID', 'WellName', 'SideTrack', 'CurrentWellStatus', 'CurrentWellType',
-            'APDReceivedDate', 'APDReturnDate', 'APDApprovedDate', 'APDExtDate',
-            'APDRescindDate', 'DrySpud', 'RotarySpud']
-
-        row_2_data: List[str] = ['WellStatusReport', 'WellTypeReport', 'FirstProdDate', 'WCRCompletionDate',
-            'TestDate', 'ProductionMethod', 'OilRate', 'GasRate', 'WaterRate', 'DST',
-            'DirSurveyRun', 'CompletionType']
+            approved_dates: pd.Series = to_datetime(current_data_row['APDApprovedDate'], errors='coerce')
+            if approved_dates.notna().any():
+                current_data_row = current_data_row.loc[[approved_dates.idxmax()]]
+            else:
+                current_data_row = current_data_row.head(1)
 
-        row_3_data: List[str] = ['GasVolume', 'OilVolume', 'WellAge', 'Last Production (if Shut In)',
-            'Months Shut In', 'Operator', 'MD', 'TVD', 'Perforation MD',
-            'Perforation TVD', 'WorkType', 'Slant']
+        # Data fields for each table (module-level constants)
+        row_1_data: Tuple[str, ...] = WELL_TABLE_FIELDS_1
+        row_2_data: Tuple[str, ...] = WELL_TABLE_FIELDS_2
+        row_3_data: Tuple[str, ...] = WELL_TABLE_FIELDS_3
 
         # Setup table structure
         self.setupTableData([row_1_data, row_2_data, row_3_data], current_data_row)
 
-        # Populate each table with corresponding data
-        for i, value in enumerate(row_1_data):
-            self.ui.well_data_table_1.item(0, i).setText(str(current_data_row[value].item()))
+        # Extract the selected record once so each cell is a plain dict lookup
+        row_values: Dict[str, Any] = current_data_row.iloc[0].to_dict()
 
-        for i, value in enumerate(row_2_data):
-            self.ui.well_data_table_2.item(0, i).setText(str(current_data_row[value].iloc[0]))
-
-        for i, value in enumerate(row_3_data):
-            self.ui.well_data_table_3.item(0, i).setText(str(current_data_row[value].iloc[0]))
+        # Populate each table with corresponding data through the cached cell items
+        for items, fields in ((self._wdt1_items, row_1_data), (self._wdt2_items, row_2_data),
+                              (self._wdt3_items, row_3_data)):
+            for item, value in zip(items, fields):
+                item.setText(str(row_values[value]))
 
         # Update 2D visualization
         self.update2dSelectedWhenWellChanges()
 
-    def setupTableData(self, row_data: List[List[str]], df: pd.DataFrame) -> None:
+    def setupTableData(self, row_data: List[Tuple[str, ...]], df: pd.DataFrame) -> None:
         """
         Sets up and populates a table view with well data using a custom model and delegate.
 
@@ -2308,57 +2733,44 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             df: DataFrame containing the well data to populate the table
 
         Side Effects:
-            - Clears and updates self.specific_well_data_model
-            - Modifies table view formatting and visibility settings
-            - Sets custom delegate for bold row styling
+            - Creates the item grid of self.specific_well_data_model on first call
+              (kept in self._well_view_items) and updates its text afterwards
+            - Resizes the table view's columns and rows to fit
 
         Notes:
             - Headers (bold rows) are at indices 0, 2, and 4
             - Data rows follow their respective headers
-            - Table adjusts column and row sizes automatically
-            - Headers are hidden for custom formatting
+            - Column and row sizes are fitted once after the data is written
+            - Headers are hidden for custom formatting; headers and the bold-row
+              delegate are configured once in setupTables
 
         Example:
             >>> row_data = [['WellID', 'WellName'], ['Status', 'Type'], ['MD', 'TVD']]
             >>> setupTableData(row_data, well_df)  # Populates table with well data
         """
-        # Clear existing table data
-        self.specific_well_data_model.removeRows(0, self.specific_well_data_model.rowCount())
-
-        # Define modified headers for the third row
-        row_3_data_edited: List[str] = ['GasVolume', 'OilVolume', 'WellAge', 'Recorded Last Production',
-            'Months Shut In (if applicable)', 'Operator', 'MD', 'TVD',
-            'Perforation MD', 'Perforation TVD', 'WorkType', 'Slant']
-
-        # Initialize data structure for table population
-        data_used_lst: List[List[str]] = [row_data[0], [], row_data[1], [], row_3_data_edited, []]
-
-        # Populate data rows from DataFrame
-        for i, value in enumerate(row_data[0]):
-            data_used_lst[1].append(str(df[value].values[0]))
-        for i, value in enumerate(row_data[1]):
-            data_used_lst[3].append(str(df[value].values[0]))
-        for i, value in enumerate(row_data[2]):
-            data_used_lst[5].append(str(df[value].values[0]))
-
-        # Create and append items to model
-        for row in data_used_lst:
-            items = [QStandardItem(str(item)) for item in row]
-            self.specific_well_data_model.appendRow(items)
-
-        # Configure table view display settings
-        self.ui.well_data_table_view.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents)
-        self.ui.well_data_table_view.verticalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents)
-        self.ui.well_data_table_view.horizontalHeader().setVisible(False)
-        self.ui.well_data_table_view.verticalHeader().setVisible(False)
-        self.ui.well_data_table_view.setModel(self.specific_well_data_model)
+        # Build the 6 x 12 item grid on first use; later calls only rewrite item text
+        if not self._well_view_items:
+            self._well_view_items = [[QStandardItem() for _ in range(12)] for _ in range(6)]
+            for items in self._well_view_items:
+                self.specific_well_data_model.appendRow(items)
 
-        # Apply custom formatting for bold rows
-        bold_rows: List[int] = [0, 2, 4]
-        delegate = MultiBoldRowDelegate(bold_rows)
-        self.ui.well_data_table_view.setItemDelegate(delegate)
+        # Initialize data structure for table population (third header row uses the display names)
+        data_used_lst: List[List[str]] = [list(row_data[0]), [], list(row_data[1]), [], list(WELL_TABLE_HEADERS_3), []]
+
+        # Populate data rows from the first DataFrame row, extracted once
+        row: pd.Series = df.iloc[0]
+        data_used_lst[1] = [str(row[value]) for value in row_data[0]]
+        data_used_lst[3] = [str(row[value]) for value in row_data[1]]
+        data_used_lst[5] = [str(row[value]) for value in row_data[2]]
+
+        # Write the text into the existing items
+        for items, texts in zip(self._well_view_items, data_used_lst):
+            for item, text in zip(items, texts):
+                item.setText(text)
+
+        # Fit the table to its new contents in one pass (header setup happens once in setupTables)
+        self.ui.well_data_table_view.resizeColumnsToContents()
+        self.ui.well_data_table_view.resizeRowsToContents()
 
     def update2dSelectedWhenWellChanges(self) -> None:
         """
@@ -2417,10 +2829,14 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - Updates spec_vertical_wells_2d scatter plot
             - Updates spec_well_2d line plot
             - Updates spec_well_3d and spec_well_3d_solo 3D plots
-            - Modifies plot limits and redraws canvases
+            - Modifies plot limits and schedules canvas repaints with draw_idle
             - Triggers production graphic updates
 
         Notes:
+            - Returns early when no docket row matches the combo box text
+            - Keeps the well artists when the well is already drawn (self._last_drawn_well) and
+              only re-runs refreshSelectedWellView; clearDataFrom2dAnd3d and loadWellData reset
+              that marker
             - Prioritizes data display in order: as-drilled > planned > vertical
             - Converts coordinates to float for plotting
             - Centers view on well's centroid with 8000-unit buffer
@@ -2429,20 +2845,35 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Example:
             >>> self.draw2dModelSelectedWell()  # Updates visualizations for selected well
         """
-        # Get well parameter data from current selection
-        df_well_data: pd.DataFrame = self.df_docket.loc[self.dx_data['DisplayName'] == self.ui.well_lst_combobox.currentText()]
-
-        # Filter directional survey data for selected well
-        df_well: pd.DataFrame = self.dx_df[self.dx_df['APINumber'] == df_well_data['WellID'].iloc[0]]
-
-        # Separate data by citing type
-        drilled_df: pd.DataFrame = df_well[df_well['CitingType'].isin(['asdrilled'])]
-        planned_df: pd.DataFrame = df_well[df_well['CitingType'].isin(['planned'])]
-        vert_df: pd.DataFrame = df_well[df_well['CitingType'].isin(['vertical'])]
-
-        # Get best available data based on priority
-        df_well = self.findPopulatedDataframeForSelection(drilled_df, planned_df, vert_df)
-        df_well.drop_duplicates(keep='first', inplace=True)
+        # Get well parameter data from current selection via the cached DisplayName row positions
+        df_well_data: pd.DataFrame = self.df_docket.take(
+            self._displayname_to_idx.get(self.ui.well_lst_combobox.currentText(), np.empty(0, dtype=np.intp)))
+
+        # Nothing to draw when the combo box names no docket well
+        if df_well_data.empty:
+            return
+
+        # A combo box re-emit for the well already on screen keeps its artists; only the view is refreshed
+        well_api: str = df_well_data['WellID'].iloc[0]
+        if well_api == self._last_drawn_well:
+            self.refreshSelectedWellView()
+            return
+
+        # Gather directional survey data for selected well from the cached APINumber row positions
+        well_rows: np.ndarray = self._dx_df_groups.get(well_api, np.empty(0, dtype=np.intp))
+        df_well: pd.DataFrame = self.dx_df.take(well_rows)
+
+        # Separate row positions by citing type
+        citing_type: np.ndarray = df_well['CitingType'].to_numpy()
+        drilled_idx: np.ndarray = np.flatnonzero(citing_type == 'asdrilled')
+        planned_idx: np.ndarray = np.flatnonzero(citing_type == 'planned')
+        vert_idx: np.ndarray = np.flatnonzero(citing_type == 'vertical')
+
+        # Gather only the best available data based on priority, tracking each row's dx_df position
+        # (no per-click dedupe: loadWellData already dropped duplicate survey rows)
+        chosen_idx: np.ndarray = self.findPopulatedDataframeForSelection(drilled_idx, planned_idx, vert_idx)
+        df_well = df_well.take(chosen_idx)
+        well_rows = well_rows[chosen_idx]
         df_well['X'] = df_well['X'].astype(float)
         df_well['Y'] = df_well['Y'].astype(float)
 
@@ -2457,11 +2888,16 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             self.spec_vertical_wells_2d.set_offsets([None, None])
             self.spec_well_2d.set_data(xy_data[:, 0], xy_data[:, 1])
 
-        # Process 3D coordinates
-        x = to_numeric(df_well['SPX'], errors='coerce')
-        y = to_numeric(df_well['SPY'], errors='coerce')
-        z = to_numeric(df_well['Targeted Elevation'], errors='coerce')
-        self.centroid = (x.mean(), y.mean(), z.mean())
+        # Process 3D coordinates (columns are numeric since loadWellData); elevation comes from the cached
+        # array while it still lines up with dx_df positions, otherwise from the Targeted Elevation column
+        if len(self._targeted_elevation) == len(self.dx_df):
+            elevation: np.ndarray = self._targeted_elevation[well_rows]
+        else:
+            elevation = df_well['Targeted Elevation'].to_numpy(dtype=np.float64)
+        xyz: np.ndarray = np.column_stack((df_well[['SPX', 'SPY']].to_numpy(dtype=np.float64, copy=False),
+                                           elevation))
+        x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        self.centroid = np.nanmean(xyz, axis=0)
 
         # Update 3D visualizations
         self.spec_well_3d.set_data(x, y)
@@ -2469,28 +2905,39 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.spec_well_3d_solo.set_data(x, y)
         self.spec_well_3d_solo.set_3d_properties(z)
 
-        # Refresh canvases
-        self.canvas2d.draw()
-        self.canvas3d.draw()
+        self._last_drawn_well = well_api
+        self.refreshSelectedWellView()
+
+    def refreshSelectedWellView(self) -> None:
+        """
+        Re-centres the solo 3D view on the selected well and refreshes the canvases.
+
+        Runs on every draw2dModelSelectedWell call, including the ones that keep the
+        already drawn well, so the view limits and production graphic stay current.
 
+        Side Effects:
+            - Sets the ax3d_solo limits to self.centroid with an 8000-unit buffer
+            - Schedules 2D, 3D and solo 3D canvas repaints with draw_idle
+            - Triggers production graphic updates
+        """
         # Set new view limits centered on well
-        new_xlim = [self.centroid[0] - 8000, self.centroid[0] + 8000]
-        new_ylim = [self.centroid[1] - 8000, self.centroid[1] + 8000]
-        new_zlim = [self.centroid[2] - 8000, self.centroid[2] + 8000]
+        new_xlim, new_ylim, new_zlim = (self.centroid[:, None] + np.array([-8000.0, 8000.0])).tolist()
 
         # Update 3D solo view limits
         self.ax3d_solo.set_xlim3d(new_xlim)
         self.ax3d_solo.set_ylim3d(new_ylim)
         self.ax3d_solo.set_zlim3d(new_zlim)
 
-        # Refresh solo canvas and production graphic
-        self.canvas3d_solo.draw()
+        # Schedule one coalesced repaint per canvas, then refresh the production graphic
+        self.canvas2d.draw_idle()
+        self.canvas3d.draw_idle()
+        self.canvas3d_solo.draw_idle()
         self.drawProductionGraphic()
 
     def findPopulatedDataframeForSelection(
-            self,drilled_df: pd.DataFrame, planned_df: pd.DataFrame, vert_df: pd.DataFrame) -> pd.DataFrame:
+            self, drilled_idx: np.ndarray, planned_idx: np.ndarray, vert_idx: np.ndarray) -> np.ndarray:
         """
-        Prioritizes and returns the first non-empty DataFrame from the provided well data sources.
+        Prioritizes and returns the first non-empty set of row positions from the provided well data sources.
 
         This method implements a prioritized selection of well data, checking in order:
         1. As-drilled data (highest priority)
@@ -2498,33 +2945,57 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         3. Vertical well data (fallback option)
 
         Args:
-            drilled_df: DataFrame containing as-drilled well survey data
-            planned_df: DataFrame containing planned well survey data
-            vert_df: DataFrame containing vertical well survey data
+            drilled_idx: Row positions of as-drilled well survey data
+            planned_idx: Row positions of planned well survey data
+            vert_idx: Row positions of vertical well survey data
 
         Returns:
-            pd.DataFrame: The first non-empty DataFrame based on priority order.
-            Will return vert_df even if empty if no other data is available.
+            np.ndarray: The first non-empty position array based on priority order.
+            Will return vert_idx even if empty if no other data is available.
 
         Notes:
             - Used to ensure visualization data is available even with partial surveys
             - Prioritizes actual drilled data over planned trajectories
             - Serves as a data selection failsafe for visualization methods
+            - Callers gather the chosen rows with a single DataFrame.take
 
         Example:
-            >>> selected_df = findPopulatedDataframeForSelection(
-            ...     drilled_df=empty_df,
-            ...     planned_df=populated_df,
-            ...     vert_df=empty_df
+            >>> selected_idx = findPopulatedDataframeForSelection(
+            ...     drilled_idx=np.array([], dtype=np.intp),
+            ...     planned_idx=np.array([0, 1, 2]),
+            ...     vert_idx=np.array([], dtype=np.intp)
             ... )
-            >>> # Returns populated_df since drilled_df is empty
+            >>> # Returns planned_idx since drilled_idx is empty
         """
-        if not drilled_df.empty:
-            return drilled_df
-        elif not planned_df.empty:
-            return planned_df
-        else:
-            return vert_df
+        # Walk the sources in priority order; an empty vert_idx is still the fallback
+        for idx in (drilled_idx, planned_idx):
+            if len(idx):
+                return idx
+        return vert_idx
+
+    def makeLabelPatches(self, points: np.ndarray, texts: List[str]) -> List[PathPatch]:
+        """
+        Builds red map-label patches, reusing one TextPath per distinct label text.
+
+        Args:
+            points: (n, 2) array-like of label anchor x/y positions
+            texts: Label strings, one per point
+
+        Returns:
+            List[PathPatch]: One patch per label, ready for PatchCollection.set_paths
+
+        Notes:
+            - TextPath construction (font layout and glyph outlines) is the expensive
+              step, so each text is laid out once at the origin and cached in
+              self._textpath_cache; placing a label is only a vertex translation
+        """
+        patches: List[PathPatch] = []
+        for (x, y), text in zip(points, texts):
+            base_path: Optional[TextPath] = self._textpath_cache.get(text)
+            if base_path is None:
+                base_path = self._textpath_cache[text] = TextPath((0, 0), text, size=75)
+            patches.append(PathPatch(base_path.transformed(Affine2D().translate(x, y)), color="red"))
+        return patches
 
     def drawTSRPlat(self) -> None:
         """
@@ -2558,6 +3029,9 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Notes:
             - Requires fieldsTester() helper function for geometry processing
             - Handles visibility toggling based on UI checkbox state
+            - Keeps the plat artists when the current board is already drawn and the plat data
+              has not been reloaded (self._last_drawn_board / self._plat_data_dirty); the view
+              limits and the dependent data are still refreshed on every call
             - Updates the plot limits based on centroid calculation
             - Attempts to update dependent data via manipulateTheDfDocketDataDependingOnCheckboxes()
         """
@@ -2567,8 +3041,8 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             Processes field data to create geometric representations and labeling for visualization.
 
             Transforms raw field data into a geometric dataset by:
-            1. Converting coordinate pairs to Point geometries
-            2. Grouping points by concentration to form polygons
+            1. Stable-sorting the vertices by adjacency order and concentration
+            2. Building every polygon in one vectorized shapely call
             3. Calculating centroids for each polygon
             4. Adding transformed labels
 
@@ -2577,187 +3051,151 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                     - Easting (float): X coordinates
                     - Northing (float): Y coordinates
                     - Conc (Any): Concentration or field identifier
+                    - _ord (int): Adjacency order tag (0 main, 1 and 2 adjacent)
 
             Returns:
                 pd.DataFrame: Processed DataFrame containing:
                     - Conc: Original field identifier
+                    - _ord: Adjacency order tag of the polygon
                     - geometry: Polygon geometries formed from point groups
                     - centroid: Centroid point for each polygon
                     - label: Transformed string label
 
             Notes:
-                - Assumes transformString() helper function exists for label creation
-                - Creates both point and polygon geometries for visualization
-                - Handles merging and cleanup of intermediate geometric data
+                - Labels come from the module-level transformString()
+                - One polygon per (_ord, Conc) pair; vertices keep their original order
+                - Rows with a missing Conc are ignored, as groupby did
                 - Uses Shapely geometry objects for spatial operations
 
             Example:
                 >>> field_data = pd.DataFrame({
                 ...     'Easting': [1.0, 2.0, 3.0],
                 ...     'Northing': [1.0, 2.0, 3.0],
-                ...     'Conc': ['A', 'A', 'B']
+                ...     'Conc': ['A', 'A', 'B'],
+                ...     '_ord': [0, 0, 1]
                 ... })
                 >>> result = fieldsTester(field_data)
             """
-            # Create point geometries from coordinates
-            df_field['geometry'] = df_field.apply(lambda row: Point(row['Easting'], row['Northing']), axis=1)
-
-            # Extract and process relevant fields
-            used_fields = df_field[['Conc', 'Easting', 'Northing', 'geometry']]
-            used_fields['geometry'] = used_fields.apply(lambda row: Point(row['Easting'], row['Northing']), axis=1)
-
-            # Helper function to create polygons from coordinate groups
-            def createFieldsPolygon(group: pd.DataFrame) -> Polygon:
-                return Polygon(zip(group['Easting'], group['Northing']))
-
-            # Create polygons grouped by concentration
-            polygons = used_fields.groupby('Conc',group_keys=False).apply(createFieldsPolygon, include_groups=False).reset_index()
-
-            # Rename geometry column
-            polygons = polygons.rename(columns={0: 'geometry'})
-
-            # Merge point and polygon data
-            merged_data = used_fields.merge(polygons, on='Conc')
-            merged_data = merged_data.drop('geometry_y', axis=1).rename(columns={'geometry_x': 'geometry'})
-
-            # Create final polygon dataset
-            df_new = merged_data.groupby('Conc').apply(lambda x: Polygon(zip(x['Easting'], x['Northing'])), include_groups=False).reset_index()
-
-            # Set column names and add derived fields
-            df_new.columns = ['Conc', 'geometry']
-            df_new['centroid'] = df_new.apply(lambda x: x['geometry'].centroid, axis=1)
-            df_new['label'] = df_new.apply(lambda x: transformString(x['Conc']), axis=1)
-
-            return df_new
-
-        def transformString(s: str) -> str:
-            """
-            Transforms a well location string from compact format to readable format.
-
-            Converts strings like "0102S03WA" to "1 2S 3W A" by:
-            1. Extracting numeric and directional components
-            2. Removing leading zeros
-            3. Adding proper spacing
-
-            Args:
-                s (str): Input string in format "TTRRSDDDW[A-Z]" where:
-                    - TT: Township number (2 digits)
-                    - RRS: Range number with S direction (3 chars)
-                    - DDDW: Distance number with W direction (3 chars)
-                    - [A-Z]: Single letter designation
-
-            Returns:
-                str: Transformed string with removed leading zeros and added spaces.
-                     Returns original string if pattern doesn't match.
-
-            Notes:
-                - Uses regex pattern matching to identify string components
-                - Maintains directional indicators (S/W) in output
-                - Preserves single letter designation without modification
-
-            Example:
-                >>> transformString("0102S03WA")
-                "1 2S 3W A"
-                >>> transformString("invalid")
-                "invalid"
-            """
-            # Pattern matching for well location format
-            parts = re.match(r'(\d{2})(\d{2}S)(\d{2}W)([A-Z])', s)
-
-            # Return original string if pattern doesn't match
-            if not parts:
-                return s
-
-            # Extract and transform components
-            part1 = str(int(parts.group(1)))  # Township number without leading zeros
-            part2 = str(int(parts.group(2)[:-1])) + parts.group(2)[-1]  # Range with S
-            part3 = str(int(parts.group(3)[:-1])) + parts.group(3)[-1]  # Distance with W
-            part4 = parts.group(4)  # Letter designation
-
-            # Format with spaces between components
-            return f"{part1} {part2} {part3} {part4}"
-
-        self.used_plat_codes = []
-
-        # Get current board data and filter adjacent plats
+            # Sort vertices by order tag and concentration, keeping their order within each group
+            df_sorted = df_field.dropna(subset=['Conc']).sort_values(['_ord', 'Conc'], kind='stable')
+            coords: np.ndarray = df_sorted[['Easting', 'Northing']].to_numpy(dtype=np.float64)
+            ords: np.ndarray = df_sorted['_ord'].to_numpy()
+            conc_values: np.ndarray = df_sorted['Conc'].to_numpy()
+
+            # A polygon starts wherever the (_ord, Conc) pair changes
+            new_ring: np.ndarray = np.ones(len(coords), dtype=bool)
+            new_ring[1:] = (ords[1:] != ords[:-1]) | (conc_values[1:] != conc_values[:-1])
+            starts: np.ndarray = np.flatnonzero(new_ring)
+            concs: np.ndarray = conc_values[starts]
+
+            # Ring index of every vertex, then all polygons in one call (rings are closed automatically)
+            ring_index: np.ndarray = np.cumsum(new_ring) - 1
+            polys: np.ndarray = shapely.polygons(shapely.linearrings(coords, indices=ring_index))
+
+            # Assemble the result with vectorized centroids and transformed labels
+            return pd.DataFrame({
+                'Conc': concs,
+                '_ord': ords[starts],
+                'geometry': polys,
+                'centroid': shapely.centroid(polys),
+                'label': [transformString(conc) for conc in concs]})
+
+        # Get current board data
         board_data = self.ui.board_matter_lst_combobox.currentText()
-        adjacent_all = self.df_adjacent_plats[self.df_adjacent_plats['Board_Docket'] == board_data]
-        df_plat_docket = self.df_plat[self.df_plat['Board_Docket'] == board_data]
-
-        # Filter adjacency orders
-        adjacent_main = adjacent_all[adjacent_all['Order'] == 0]
-        adjacent_1 = adjacent_all[adjacent_all['Order'] == 1]
-        adjacent_2 = adjacent_all[adjacent_all['Order'] == 2]
-
-        # Get plat data for each adjacency level
-        adjacent_main_plats = df_plat_docket[df_plat_docket['Conc'].isin(adjacent_main['src_FullCo'].unique())]
-        adjacent_1_plats = df_plat_docket[df_plat_docket['Conc'].isin(adjacent_1['src_FullCo'].unique())]
-        adjacent_2_plats = df_plat_docket[df_plat_docket['Conc'].isin(adjacent_2['src_FullCo'].unique())]
-
-        # Process geometry data
-        plat_data_main = fieldsTester(adjacent_main_plats)
-        plat_data_adjacent_1 = fieldsTester(adjacent_1_plats)
-        plat_data_adjacent_2 = fieldsTester(adjacent_2_plats)
-
-        # Create text labels with paths
-        paths_main = [
-            PathPatch(TextPath((coord.x, coord.y), text, size=75), color="red")
-            for coord, text in zip(plat_data_main['centroid'], plat_data_main['label'])
-        ]
-        paths_adjacent_1 = [
-            PathPatch(TextPath((coord.x, coord.y), text, size=75), color="red")
-            for coord, text in zip(plat_data_adjacent_1['centroid'], plat_data_adjacent_1['label'])
-        ]
-        paths_adjacent_2 = [
-            PathPatch(TextPath((coord.x, coord.y), text, size=75), color="red")
-            for coord, text in zip(plat_data_adjacent_2['centroid'], plat_data_adjacent_2['label'])
-        ]
-
-        # Set label paths
-        self.labels_plats_2d_main.set_paths(paths_main)
-        self.labels_plats_2d_1adjacent.set_paths(paths_adjacent_1)
-        self.labels_plats_2d_2adjacent.set_paths(paths_adjacent_2)
-
-        # Set geometry segments
-        self.plats_2d_main.set_segments(
-            plat_data_main['geometry'].apply(lambda x: x.exterior.coords)
-        )
-        self.plats_2d_1adjacent.set_segments(
-            plat_data_adjacent_1['geometry'].apply(lambda x: x.exterior.coords)
-        )
-        self.plats_2d_2adjacent.set_segments(
-            plat_data_adjacent_2['geometry'].apply(lambda x: x.exterior.coords)
-        )
 
-        # Calculate and set plot limits based on centroid
-        all_polygons = unary_union(plat_data_main['geometry'].tolist())
-        overall_centroid = all_polygons.centroid
-        self.ax2d.set_xlim(overall_centroid.x - 10000, overall_centroid.x + 10000)
-        self.ax2d.set_ylim(overall_centroid.y - 10000, overall_centroid.y + 10000)
-
-        # Update plat codes and visibility
-        self.used_plat_codes = plat_data_main['Conc'].unique().tolist()
-        self.plats_2d_main.set_visible(True)
-        self.plats_2d_1adjacent.set_visible(True)
-        self.plats_2d_2adjacent.set_visible(True)
-
-        # Handle label visibility based on checkbox
-        label_visibility = self.ui.section_label_checkbox.isChecked()
-        for labels in [self.labels_plats_2d_main,
-                       self.labels_plats_2d_1adjacent,
-                       self.labels_plats_2d_2adjacent]:
-            labels.set_visible(True)  # Always visible per original logic
-
-        # Compile all unique plat codes
-        self.used_plat_codes_for_boards = list(set(
-            plat_data_main['Conc'].unique().tolist() +
-            plat_data_adjacent_1['Conc'].unique().tolist() +
-            plat_data_adjacent_2['Conc'].unique().tolist()
-        ))
-
-        # Update canvas
-        self.canvas2d.blit(self.ax2d.bbox)
-        self.canvas2d.draw()
+        # Cascading UI events for the board already on screen keep its artists as they are
+        board_changed: bool = board_data != self._last_drawn_board or self._plat_data_dirty
+
+        # Reuse the processed plat geometry for recently drawn boards (LRU keyed on board_data)
+        cached_plats = self._plat_cache.get(board_data)
+        if cached_plats is None:
+            # Gather the board's adjacent plats and plat rows from the cached Board_Docket positions
+            no_rows: np.ndarray = np.empty(0, dtype=np.intp)
+            adjacent_all = self.df_adjacent_plats.take(self._adjacent_by_board.get(board_data, no_rows))
+            df_plat_docket = self.df_plat.take(self._plat_by_board.get(board_data, no_rows))
+
+            # Tag each plat row with its adjacency orders in one hash join (a section listed at two levels
+            # yields a row per level; the inner merge keeps df_plat_docket's vertex order)
+            plat_orders: pd.DataFrame = adjacent_all.loc[adjacent_all['Order'].isin([0, 1, 2]), ['src_FullCo', 'Order']]
+            plat_orders = plat_orders.drop_duplicates().rename(columns={'src_FullCo': 'Conc', 'Order': '_ord'})
+
+            # Process geometry data for all three levels in one pass, then split it by order tag
+            plat_data = fieldsTester(df_plat_docket.merge(plat_orders, on='Conc', how='inner'))
+            plat_by_order: Dict[int, np.ndarray] = plat_data.groupby('_ord', sort=False).indices
+            plat_data_main = plat_data.take(plat_by_order.get(0, no_rows)).reset_index(drop=True)
+            plat_data_adjacent_1 = plat_data.take(plat_by_order.get(1, no_rows)).reset_index(drop=True)
+            plat_data_adjacent_2 = plat_data.take(plat_by_order.get(2, no_rows)).reset_index(drop=True)
+
+            # Create text labels with paths (glyph outlines are reused from the TextPath cache)
+            paths_main = self.makeLabelPatches(
+                shapely.get_coordinates(plat_data_main['centroid'].to_numpy()), plat_data_main['label'])
+            paths_adjacent_1 = self.makeLabelPatches(
+                shapely.get_coordinates(plat_data_adjacent_1['centroid'].to_numpy()), plat_data_adjacent_1['label'])
+            paths_adjacent_2 = self.makeLabelPatches(
+                shapely.get_coordinates(plat_data_adjacent_2['centroid'].to_numpy()), plat_data_adjacent_2['label'])
+
+            # Outline vertices of each plat level, extracted in bulk
+            segments_main = exteriorRingCoords(plat_data_main['geometry'].to_numpy())
+            segments_adjacent_1 = exteriorRingCoords(plat_data_adjacent_1['geometry'].to_numpy())
+            segments_adjacent_2 = exteriorRingCoords(plat_data_adjacent_2['geometry'].to_numpy())
+
+            # Calculate the view centre from the main plats as their area-weighted centroid (equal to the
+            # union's centroid for non-overlapping sections, without GEOS polygon merging)
+            main_polys: np.ndarray = plat_data_main['geometry'].to_numpy()
+            areas: np.ndarray = shapely.area(main_polys)
+            centres: np.ndarray = shapely.get_coordinates(plat_data_main['centroid'].to_numpy())
+            overall_centroid: np.ndarray = (
+                (centres * areas[:, None]).sum(axis=0) / areas.sum() if areas.sum() > 0 else centres.mean(axis=0))
+
+            cached_plats = (plat_data_main, plat_data_adjacent_1, plat_data_adjacent_2,
+                            paths_main, paths_adjacent_1, paths_adjacent_2,
+                            segments_main, segments_adjacent_1, segments_adjacent_2, overall_centroid)
+            self._plat_cache[board_data] = cached_plats
+            if len(self._plat_cache) > PLAT_CACHE_SIZE:
+                self._plat_cache.popitem(last=False)
+        else:
+            self._plat_cache.move_to_end(board_data)
+
+        (plat_data_main, plat_data_adjacent_1, plat_data_adjacent_2,
+         paths_main, paths_adjacent_1, paths_adjacent_2,
+         segments_main, segments_adjacent_1, segments_adjacent_2, overall_centroid) = cached_plats
+
+        if board_changed:
+            # Set label paths
+            self.labels_plats_2d_main.set_paths(paths_main)
+            self.labels_plats_2d_1adjacent.set_paths(paths_adjacent_1)
+            self.labels_plats_2d_2adjacent.set_paths(paths_adjacent_2)
+
+            # Set geometry segments
+            self.plats_2d_main.set_segments(segments_main)
+            self.plats_2d_1adjacent.set_segments(segments_adjacent_1)
+            self.plats_2d_2adjacent.set_segments(segments_adjacent_2)
+
+            # Update plat codes and visibility
+            self.used_plat_codes = plat_data_main['Conc'].unique().tolist()
+
+            # Plats and their labels are always visible (per original logic); only touch artists that were hidden
+            for artist in [self.plats_2d_main, self.plats_2d_1adjacent, self.plats_2d_2adjacent,
+                           self.labels_plats_2d_main, self.labels_plats_2d_1adjacent, self.labels_plats_2d_2adjacent]:
+                if not artist.get_visible():
+                    artist.set_visible(True)
+
+            # Compile all unique plat codes with one hash-based pass over the combined arrays
+            self.used_plat_codes_for_boards = pd.unique(np.concatenate([
+                plat_data_main['Conc'].to_numpy(),
+                plat_data_adjacent_1['Conc'].to_numpy(),
+                plat_data_adjacent_2['Conc'].to_numpy()
+            ])).tolist()
+
+        # Set plot limits based on centroid
+        self.ax2d.set_xlim(overall_centroid[0] - 10000, overall_centroid[0] + 10000)
+        self.ax2d.set_ylim(overall_centroid[1] - 10000, overall_centroid[1] + 10000)
+
+        # New plat geometry and limits invalidate any cached background, so queue one full render
+        # (a blit right before draw() was redundant; the docket-change caller draws again at the end)
+        self.canvas2d.draw_idle()
+        self._last_drawn_board = board_data
+        self._plat_data_dirty = False
 
         # Try to update dependent data
         try:
@@ -2772,28 +3210,20 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Initialize data containers
         self.planned_xy_2d, self.planned_xy_3d, self.drilled_xy_2d, self.drilled_xy_3d, self.currently_drilling_xy_2d, self.currently_drilling_xy_3d = [], [], [], [], [], []
 
-        # Generate masks for data filtering
-        mask_drilled, mask_planned, mask_drilling = self.generateMasks()
-
-        # Generate age-based masks
-        age_masks = self.createAgeMasks()
-
-        # Clean data
-        self.df_docket_data = self.cleanData(self.df_docket_data)
+        # Classify every well once, then derive the type and age masks from its bits
+        well_class = self.classifyDocketData()
+        mask_drilled, mask_planned, mask_drilling = self.generateMasks(well_class)
 
-        # Generate dataframes based on conditions
+        # Age bin of every well (buckets are cumulative: bin <= k)
+        age_bins = self.createAgeBins(well_class)
 
-        # For drilled
-        drilled_dfs = self.generateDataframes('drilled', mask_drilled, age_masks)
-        # For planned
-        planned_dfs = self.generateDataframes('planned', mask_planned, age_masks)
-        # For currently drilling
-        currently_drilling_dfs = self.generateDataframes('currently_drilling', mask_drilling, age_masks)
+        # Generate dataframes for drilled, planned and currently drilling wells in one pass
+        well_dfs = self.generateDataframes(
+            {'drilled': mask_drilled, 'planned': mask_planned, 'currently_drilling': mask_drilling}, age_bins)
 
-
-        drilled_dataframes = [drilled_dfs['drilled_year'], drilled_dfs['drilled_5years'], drilled_dfs['drilled_10years'], drilled_dfs['drilled_all']]
-        planned_dataframes = [planned_dfs['planned_year'], planned_dfs['planned_5years'], planned_dfs['planned_10years'], planned_dfs['planned_all']]
-        currently_drilling_dataframes = [currently_drilling_dfs['currently_drilling_year'], currently_drilling_dfs['currently_drilling_5years'], currently_drilling_dfs['currently_drilling_10years'], currently_drilling_dfs['currently_drilling_all']]
+        drilled_dataframes = [well_dfs['drilled_year'], well_dfs['drilled_5years'], well_dfs['drilled_10years'], well_dfs['drilled_all']]
+        planned_dataframes = [well_dfs['planned_year'], well_dfs['planned_5years'], well_dfs['planned_10years'], well_dfs['planned_all']]
+        currently_drilling_dataframes = [well_dfs['currently_drilling_year'], well_dfs['currently_drilling_5years'], well_dfs['currently_drilling_10years'], well_dfs['currently_drilling_all']]
 
         # Filter out planned data based on drilled data
         planned_dataframes = self.filterPlannedData(drilled_dataframes, planned_dataframes)
@@ -2807,21 +3237,26 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         Performs the following operations in sequence:
         1. Removes duplicate rows keeping first occurrence
-        2. Sorts data by API number
-        3. Resets DataFrame index
-        4. Fills missing well ages with 0
+        2. Drops rows without a targeted elevation (cleanData)
+        3. Sorts data by API number and measured depth
+        4. Resets DataFrame index
+        5. Fills missing well ages with 0
+        6. Stores CitingType and CurrentWellStatus as categoricals
 
         Args:
             self: Parent class instance
             df (pd.DataFrame): Input DataFrame containing well data.
                 Required columns:
                 - APINumber: Well identification number
+                - MeasuredDepth: Depth along the wellbore (numeric)
                 - WellAge: Age of the well (can contain NaN values)
+                - Targeted Elevation: Well target elevation (can contain NaN values)
 
         Returns:
             pd.DataFrame: Processed DataFrame with:
                 - No duplicates
-                - Sorted by APINumber
+                - No missing targeted elevations
+                - Sorted by APINumber, then MeasuredDepth
                 - Reset index
                 - WellAge filled with 0 for missing values
 
@@ -2830,6 +3265,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - Assumes APINumber is a valid sorting key
             - Treatment of NaN well ages as 0 typically indicates planned/permitted wells
             - Original index is dropped during reset
+            - Cleaning happens before masks are built, so they only scan rows that are kept
 
         Example:
             >>> df = pd.DataFrame({
@@ -2840,17 +3276,67 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             >>> processed_df['APINumber'].tolist()
             [1, 2, 3]
         """
-        # Remove duplicates and sort
-        df = df.drop_duplicates(keep='first')
-        df = df.sort_values(by='APINumber')
+        # Remove duplicates (APINumber repeats per survey station, so whole rows stay the key)
+        # and rows that cleanData would discard, before any further pass touches them
+        df = self.cleanData(df.drop_duplicates(keep='first'))
+
+        # Order rows once by the integer codes of APINumber, then MeasuredDepth (missing values last, as
+        # sort_values did), skipping the reorder when the source is already sorted
+        api_codes, api_uniques = pd.factorize(df['APINumber'], sort=True)
+        api_codes[api_codes < 0] = len(api_uniques)
+        order: np.ndarray = np.lexsort((df['MeasuredDepth'].to_numpy(dtype=np.float64), api_codes))
+        if np.any(order[1:] < order[:-1]):
+            df = df.take(order)
 
         # Reset index and handle missing ages
         df = df.reset_index(drop=True)
         df['WellAge'] = df['WellAge'].fillna(0)
 
+        # Categorical classifiers so classifyDocketData compares integer codes instead of strings
+        df['CitingType'] = df['CitingType'].astype('category')
+        df['CurrentWellStatus'] = df['CurrentWellStatus'].astype('category')
+
         return df
 
-    def generateMasks(self) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    def classifyDocketData(self) -> np.ndarray:
+        """
+        Classifies every docket well by type, status and age in one pass.
+
+        Args:
+            self: Parent class instance containing:
+                - df_docket_data (pd.DataFrame): DataFrame with well information
+                    Required columns:
+                    - CitingType: Type of well citation (categorical, see preprocessData)
+                    - CurrentWellStatus: Current status of the well (categorical)
+                    - WellAge: Age of wells in months
+
+        Returns:
+            np.ndarray: uint8 classification per row of df_docket_data (see classifyWells)
+
+        Notes:
+            - Compares categorical integer codes; a category that is absent maps to -2 so it
+              can never match the -1 code of missing values
+            - Reads each column once as a raw array; ages are compared as float32 to halve
+              the bytes scanned (the month thresholds are exact in float32)
+            - Plain arrays are safe because preprocessData has already dropped and reindexed rows
+        """
+        df = self.df_docket_data
+
+        # Codes of the classifying categories
+        citing_lookup: np.ndarray = df['CitingType'].cat.categories.get_indexer(['asdrilled', 'vertical', 'planned'])
+        citing_lookup[citing_lookup < 0] = -2
+        status_lookup: np.ndarray = df['CurrentWellStatus'].cat.categories.get_indexer(['Drilling'])
+        status_lookup[status_lookup < 0] = -2
+        asdrilled, vertical, planned = (int(code) for code in citing_lookup)
+
+        # Raw column arrays, each pulled out of the DataFrame once
+        citing_codes: np.ndarray = df['CitingType'].cat.codes.to_numpy()
+        status_codes: np.ndarray = df['CurrentWellStatus'].cat.codes.to_numpy()
+        well_age: np.ndarray = df['WellAge'].to_numpy(dtype=np.float32)
+
+        return classifyWells(citing_codes, status_codes, well_age, asdrilled, vertical, planned, int(status_lookup[0]))
+
+    def generateMasks(self, well_class: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generates boolean masks for filtering well data based on drilling status and type.
 
@@ -2860,14 +3346,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         3. Currently drilling wells
 
         Args:
-            self: Parent class instance containing:
-                - df_docket_data (pd.DataFrame): DataFrame with well information
-                    Required columns:
-                    - CitingType: Type of well citation
-                    - CurrentWellStatus: Current status of the well
+            well_class (np.ndarray): Packed classification from classifyDocketData
 
         Returns:
-            Tuple[pd.Series, pd.Series, pd.Series]: Three boolean masks:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Three boolean masks:
                 - mask_drilled: True for already drilled/completed wells
                 - mask_planned: True for planned/permitted wells
                 - mask_drilling: True for currently drilling wells
@@ -2876,67 +3358,47 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             - CitingType values considered as drilled: ['asdrilled', 'vertical']
             - CitingType values considered as planned: ['planned', 'vertical']
             - CurrentWellStatus value for drilling: ['Drilling']
+            - Each mask tests one bit of well_class
             - Masks can be used directly for DataFrame filtering
 
         Example:
-            >>> drilled, planned, drilling = self.generateMasks()
+            >>> drilled, planned, drilling = self.generateMasks(self.classifyDocketData())
             >>> drilled_wells = self.df_docket_data[drilled]
             >>> planned_wells = self.df_docket_data[planned]
             >>> drilling_wells = self.df_docket_data[drilling]
         """
-        # Generate mask for drilled/completed wells
-        mask_drilled = self.df_docket_data['CitingType'].isin(['asdrilled', 'vertical'])
-
-        # Generate mask for planned/permitted wells
-        mask_planned = self.df_docket_data['CitingType'].isin(['planned', 'vertical'])
-
-        # Generate mask for currently drilling wells
-        mask_drilling = self.df_docket_data['CurrentWellStatus'].isin(['Drilling'])
-
-        return mask_drilled, mask_planned, mask_drilling
+        return tuple((well_class & bit) != 0 for bit in (WELL_CLASS_DRILLED, WELL_CLASS_PLANNED, WELL_CLASS_DRILLING))
 
-    def createAgeMasks(self) -> List[pd.Series]:
+    def createAgeBins(self, well_class: np.ndarray) -> np.ndarray:
         """
-        Creates boolean masks for filtering wells based on age thresholds.
+        Extracts the age bin of every well for age-range filtering.
 
-        Generates four boolean masks representing different well age ranges:
-        1. Wells up to 1 year old (≤12 months)
-        2. Wells up to 5 years old (≤60 months)
-        3. Wells up to 10 years old (≤120 months)
-        4. All wells regardless of age (≤9999 months)
+        Age bins are cumulative thresholds, so a well in bin k belongs to every age
+        range from k upward:
+        0. Wells up to 1 year old (≤12 months)
+        1. Wells up to 5 years old (≤60 months)
+        2. Wells up to 10 years old (≤120 months)
+        3. All wells regardless of age (≤9999 months)
 
         Args:
-            self: Parent class instance containing:
-                - df_docket_data (pd.DataFrame): DataFrame with well information
-                    Required columns:
-                    - WellAge: Age of wells in months
+            well_class (np.ndarray): Packed classification from classifyDocketData
 
         Returns:
-            List[pd.Series]: List of four boolean masks where True indicates
-            wells within the respective age thresholds:
-            - mask[0]: Age ≤ 12 months
-            - mask[1]: Age ≤ 60 months
-            - mask[2]: Age ≤ 120 months
-            - mask[3]: Age ≤ 9999 months (effectively all wells)
+            np.ndarray: uint8 age bin per row of df_docket_data; the wells within age
+            range k are those with bin <= k (bin 4 is beyond 9999 months)
 
         Notes:
             - WellAge is expected to be in months
             - Missing/NaN ages should be handled before calling this function
-            - Masks can be used directly for DataFrame filtering
             - The 9999 threshold effectively includes all wells
+            - Reads the age bin stored in the upper bits of well_class
 
         Example:
-            >>> age_masks = self.createAgeMasks()
-            >>> new_wells = self.df_docket_data[age_masks[0]]  # Wells ≤ 1 year
-            >>> mature_wells = self.df_docket_data[age_masks[2]]  # Wells ≤ 10 years
-        """
-        # Create list of boolean masks for different age thresholds
-        return [
-            (self.df_docket_data['WellAge'] <= 12),  # 1 year threshold
-            (self.df_docket_data['WellAge'] <= 60),  # 5 year threshold
-            (self.df_docket_data['WellAge'] <= 120),  # 10 year threshold
-            (self.df_docket_data['WellAge'] <= 9999)  # All wells threshold
-        ]
+            >>> age_bins = self.createAgeBins(self.classifyDocketData())
+            >>> new_wells = self.df_docket_data[age_bins <= 0]  # Wells ≤ 1 year
+            >>> mature_wells = self.df_docket_data[age_bins <= 2]  # Wells ≤ 10 years
+        """
+        return well_class >> WELL_AGE_BIN_SHIFT
 
     def cleanData(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -2978,16 +3440,15 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
     def generateDataframes(
             self,
-            mask_type: Literal['drilled', 'planned', 'drilling'],
-            mask: pd.Series,
-            age_masks: list[pd.Series]
+            type_masks: Dict[str, np.ndarray],
+            age_bins: np.ndarray
     ) -> Dict[str, pd.DataFrame]:
         """
         Generates filtered DataFrames based on well type and age ranges.
 
-        Creates a dictionary of DataFrames filtered by the specified mask type
-        (drilled/planned/drilling) and four different age ranges. Each DataFrame
-        is sorted and index-reset for consistency.
+        Creates a dictionary of DataFrames filtered by every mask type
+        (drilled/planned/currently drilling) and four different age ranges. Each
+        DataFrame keeps the sorted row order and is index-reset for consistency.
 
         Args:
             self: Parent class instance containing:
@@ -2995,45 +3456,53 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                     Required columns:
                     - APINumber: Well identification number
                     - MeasuredDepth: Well depth measurement
-            mask_type (Literal['drilled', 'planned', 'drilling']): Type of wells to filter
-            mask (pd.Series): Boolean mask identifying well type
-            age_masks (list[pd.Series]): List of 4 boolean masks for age filtering:
-                - age_masks[0]: ≤ 12 months
-                - age_masks[1]: ≤ 60 months
-                - age_masks[2]: ≤ 120 months
-                - age_masks[3]: All wells
+            type_masks (Dict[str, np.ndarray]): Boolean mask per well type, keyed by the
+                type name used in the output keys ('drilled', 'planned', 'currently_drilling')
+            age_bins (np.ndarray): Age bin per row from createAgeBins; range k keeps bin <= k:
+                - 0: ≤ 12 months
+                - 1: ≤ 60 months
+                - 2: ≤ 120 months
+                - 3: All wells
 
         Returns:
-            Dict[str, pd.DataFrame]: Dictionary containing filtered DataFrames:
+            Dict[str, pd.DataFrame]: Dictionary containing, for every mask type:
                 - {mask_type}_year: Wells within 1 year
                 - {mask_type}_5years: Wells within 5 years
                 - {mask_type}_10years: Wells within 10 years
                 - {mask_type}_all: All wells of specified type
 
         Notes:
-            - All DataFrames are sorted by APINumber and MeasuredDepth
+            - All DataFrames are sorted by APINumber and MeasuredDepth (inherited from preprocessData)
             - Indexes are reset for all DataFrames
+            - df_docket_data is gathered once for the union of all types; every bucket is
+              then taken by integer position from that smaller frame
             - Empty DataFrames may be returned if no wells match criteria
             - Original data is not modified
 
         Example:
-            >>> drilled_dfs = generateDataframes(self, 'drilled', mask_drilled, age_masks)
-            >>> print(f"New drilled wells: {len(drilled_dfs['drilled_year'])}")
-            >>> print(f"All drilled wells: {len(drilled_dfs['drilled_all'])}")
+            >>> well_dfs = generateDataframes(self, {'drilled': mask_drilled}, age_bins)
+            >>> print(f"New drilled wells: {len(well_dfs['drilled_year'])}")
+            >>> print(f"All drilled wells: {len(well_dfs['drilled_all'])}")
         """
         # Initialize dictionary for storing filtered DataFrames
         dataframes = {}
 
-        # Generate DataFrames for each age range
-        for i, age_range in enumerate(['year', '5years', '10years', 'all']):
-            # Create dictionary key combining mask type and age range
-            key = f"{mask_type}_{age_range}"
+        # Gather every row that belongs to any type in one pass; increasing positions keep preprocessData's
+        # APINumber/MeasuredDepth order, so no subset needs sorting again
+        positions: np.ndarray = np.flatnonzero(np.logical_or.reduce(list(type_masks.values())))
+        base = self.df_docket_data.take(positions)
+        base_age_bins: np.ndarray = age_bins[positions]
 
-            # Filter data using combined masks and sort
-            dataframes[key] = self.df_docket_data.loc[mask & age_masks[i]]
-            dataframes[key] = dataframes[key].reset_index(drop=True).sort_values(
-                by=['APINumber', 'MeasuredDepth']
-            )
+        for mask_type, mask in type_masks.items():
+            base_mask: np.ndarray = mask[positions]
+
+            # Generate DataFrames for each age range
+            for i, age_range in enumerate(['year', '5years', '10years', 'all']):
+                # Create dictionary key combining mask type and age range
+                key = f"{mask_type}_{age_range}"
+
+                # Take the rows of this type that fall in this age range by position
+                dataframes[key] = base.take(np.flatnonzero(base_mask & (base_age_bins <= i))).reset_index(drop=True)
 
         return dataframes
 
@@ -3125,6 +3594,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Notes:
             - Uses APINumber for well identification and matching
             - Case-sensitive matching for 'Drilling' status
+            - CurrentWellStatus is categorical here (see preprocessData); the test runs in
+              plannedKeep on integer codes
+            - Without numba, drilled API numbers are binary searched (drilled_df is sorted by
+              APINumber) rather than factorized
             - Does not modify input DataFrames
             - Returns empty DataFrame if all planned wells are filtered out
 
@@ -3135,13 +3608,33 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             ... )
             >>> print(f"Remaining planned wells: {len(filtered_planned)}")
         """
-        # Filter out wells that are either drilled or currently drilling
-        planned_year = planned_df[
-            ~planned_df['APINumber'].isin(drilled_df['APINumber']) &
-            (planned_df['CurrentWellStatus'] != 'Drilling')
-            ]
+        planned_api: np.ndarray = planned_df['APINumber'].to_numpy()
+        drilled_api: np.ndarray = drilled_df['APINumber'].to_numpy()
+
+        # Status codes of the (categorical) CurrentWellStatus column; an absent 'Drilling' never matches
+        status: pd.Series = planned_df['CurrentWellStatus']
+        drilling: int = int(status.cat.categories.get_indexer(['Drilling'])[0])
+        if drilling < 0:
+            drilling = -2
+        status_codes: np.ndarray = status.cat.codes.to_numpy()
+
+        if NUMBA_AVAILABLE or planned_df['APINumber'].hasnans or drilled_df['APINumber'].hasnans:
+            # Code both API number columns in one factorize pass so the kernel compares integers
+            # (missing numbers get a code of their own and match each other, as isin did)
+            api_codes, api_uniques = pd.factorize(np.concatenate([planned_api, drilled_api]), use_na_sentinel=False)
+            keep: np.ndarray = plannedKeep(api_codes[:len(planned_api)], api_codes[len(planned_api):],
+                                           len(api_uniques), status_codes, drilling)
+        else:
+            # Drilled rows arrive sorted by APINumber (preprocessData), so binary search them directly
+            # instead of hashing both columns
+            drilled_hit: np.ndarray = np.zeros(len(planned_api), dtype=bool)
+            if len(drilled_api):
+                pos: np.ndarray = np.minimum(np.searchsorted(drilled_api, planned_api), len(drilled_api) - 1)
+                drilled_hit = drilled_api[pos] == planned_api
+            keep = ~drilled_hit & (status_codes != drilling)
 
-        return planned_year
+        # Filter out wells that are either drilled or currently drilling
+        return planned_df[keep]
 
     def prepareFinalData(
             self,
@@ -3241,7 +3734,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         Args:
             self: Parent class instance containing:
-                - createXYPointsDict method for coordinate extraction
+                - createXYPointsBlock method for coordinate extraction
                 - {data_type}_xy_2d attribute lists for 2D plotting
                 - {data_type}_xy_3d attribute lists for 3D plotting
             df (pd.DataFrame): Well data DataFrame containing:
@@ -3268,38 +3761,34 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             >>> processSingleDataframe(df_wells, 'drilled', 0)
             # Updates self.drilled_xy_2d[0] and self.drilled_xy_3d[0] with new coordinates
         """
-        # Generate dictionary of XY points for each well
-        xy_points_dict = self.createXYPointsDict(df)
-
-        # Get unique API numbers from the DataFrame
-        apinums: Set[str] = set(df['APINumber'])
+        # Gather the XY points of every well into one block with per-well offsets
+        points, offsets, api_numbers = self.createXYPointsBlock(df)
 
         # Create attribute keys for storing coordinates
         xy_2d_key = f"{data_type}_xy_2d"
         xy_3d_key = f"{data_type}_xy_3d"
 
-        # Extract 2D coordinates (X,Y) for visualization
-        xy_2d_data = [[r[:2] for r in v] for k, v in xy_points_dict.items()
-                      if k in apinums]
+        # Extract 2D coordinates (X,Y) for visualization as views into the block; every well in it
+        # comes from df, so no membership filter is needed
+        xy_2d_data = [points[offsets[i]:offsets[i + 1], :2] for i in range(len(api_numbers))]
 
-        # Extract 3D coordinates (Z coordinates) for visualization
-        xy_3d_data = [[r[2:] for r in v] for k, v in xy_points_dict.items()
-                      if k in apinums]
+        # Extract 3D coordinates (SPX, SPY, Z) for visualization
+        xy_3d_data = [points[offsets[i]:offsets[i + 1], 2:] for i in range(len(api_numbers))]
 
         # Store processed coordinate data in instance attributes
         getattr(self, xy_2d_key).append(xy_2d_data)
         getattr(self, xy_3d_key).append(xy_3d_data)
 
-    def createXYPointsDict(
+    def createXYPointsBlock(
             self,
             df: pd.DataFrame
-    ) -> Dict[str, List[List[float]]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Creates a dictionary mapping API numbers to their coordinate points and elevation data.
+        Collects every well's coordinate points and elevation data into one contiguous block.
 
-        Groups well data by API number and creates coordinate lists containing surface
-        coordinates (X,Y), state plane coordinates (SPX,SPY) and targeted elevation for
-        each well.
+        Orders well rows by API number and stores surface coordinates (X,Y), state plane
+        coordinates (SPX,SPY) and targeted elevation in a single array, with offsets
+        marking where each well's rows start.
 
         Args:
             self: Parent class instance
@@ -3313,33 +3802,34 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                 - Targeted Elevation: Well's target elevation
 
         Returns:
-            Dict[str, List[List[float]]]: Dictionary where:
-                - Keys: API numbers (str)
-                - Values: List of coordinate lists, each containing:
-                    [x, y, spx, spy, z] where:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                - points: (n, 5) float64 array of rows [x, y, spx, spy, z] where:
                     - x,y: Surface coordinates
                     - spx,spy: State plane coordinates
                     - z: Targeted elevation
+                - offsets: Start row of each well in points followed by n (len = wells + 1)
+                - api_numbers: API number of each well, in sorted order
 
         Notes:
-            - All coordinate values are converted to float type
+            - All coordinate values are converted to float64
             - Handles missing values by converting to float (may result in NaN)
-            - Groups data by APINumber to maintain well identity
-            - Coordinates are organized for both 2D and 3D visualization use
+            - Rows with a missing APINumber are skipped; each well keeps its row order
+            - Well i occupies points[offsets[i]:offsets[i + 1]]
 
         Example:
-            >>> xy_dict = createXYPointsDict(well_df)
-            >>> first_well = next(iter(xy_dict.values()))
-            >>> print(f"First well coordinates: {first_well[0]}")
-            First well coordinates: [1234.5, 5678.9, 1000.0, 2000.0, 3500.0]
-        """
-        return {k: [[x, y, spx, spy, z] for x, y, spx, spy, z in
-                zip(g['X'].astype(float),
-                    g['Y'].astype(float),
-                    g['SPX'].astype(float),
-                    g['SPY'].astype(float),
-                    g['Targeted Elevation'].astype(float))]
-            for k, g in df.groupby('APINumber')}
+            >>> points, offsets, api_numbers = createXYPointsBlock(well_df)
+            >>> print(f"First well coordinates: {points[offsets[0]]}")
+            First well coordinates: [1234.5 5678.9 1000.  2000.  3500. ]
+        """
+        # Group rows by sorted API number codes (stable, so each well keeps its row order)
+        api_codes, api_uniques = pd.factorize(df['APINumber'], sort=True)
+        order: np.ndarray = np.argsort(api_codes, kind='stable')
+        order = order[api_codes[order] >= 0]
+
+        # One float64 block of all coordinates, with offsets where the API code changes
+        points: np.ndarray = df[['X', 'Y', 'SPX', 'SPY', 'Targeted Elevation']].to_numpy(dtype=np.float64)[order]
+        offsets: np.ndarray = np.concatenate(([0], np.flatnonzero(np.diff(api_codes[order])) + 1, [len(points)]))
+        return points, offsets, np.asarray(api_uniques)
 
     def returnWellDataDependingOnParametersTest(self) -> None:
         """
@@ -3861,10 +4351,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             if field_checkbox_state:
                 self.field_sections.set_visible(True)
                 # Create field label paths with consistent styling
-                paths = [
-                    PathPatch(TextPath((coord.x, coord.y), text, size=75), color="red")
-                    for coord, text in zip(self.field_centroids_lst, self.field_labels)
-                ]
+                paths = self.makeLabelPatches(self.field_centroids_lst, self.field_labels)
                 self.labels_field.set_paths(paths)
                 self.labels_field.set_visible(True)
             else:
@@ -4046,8 +4533,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Handle field name visibility
         if self.ui.field_names_checkbox.isChecked():
             self.field_sections.set_visible(True)
-            paths = [PathPatch(TextPath((coord.x, coord.y), text, size=75), color="red")
-                     for coord, text in zip(self.field_centroids_lst, self.field_labels)]
+            paths = self.makeLabelPatches(self.field_centroids_lst, self.field_labels)
             self.labels_field.set_paths(paths)
             self.labels_field.set_visible(True)
         else:
@@ -4081,6 +4567,9 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             self.all_wells_2d_current, self.all_wells_3d_current,
             self.all_wells_2d_vertical_current, currently_drilling_segments_3d)
 
+        # Rebuild the per-well lookups used by the click handlers
+        self.indexCurrentlyUsedLines()
+
         # Update 3D plot boundaries if drilled segments exist
         if drilled_segments_3d:
             self.centroid, std_vals = self.calculateCentroidNP(drilled_segments_3d)
@@ -4097,6 +4586,85 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.canvas3d.blit(self.ax3d.bbox)
         self.canvas3d.draw()
 
+    def indexCurrentlyUsedLines(self) -> None:
+        """
+        Builds per-well coordinate lookups from the currently displayed well lines.
+
+        Groups self.currently_used_lines by APINumber once so the click handlers
+        (onRowClicked, onClick2d) can fetch a well's path without scanning and
+        re-casting the whole DataFrame on every click.
+
+        Side Effects:
+            - Sets self._lines_by_api: APINumber -> (n, 5) float64 array of
+              X, Y, SPX, SPY, Targeted Elevation
+            - Sets self._wells_x, self._wells_y (float32 offsets from
+              self._wells_origin) and self._wells_api: one entry per displayed well point
+            - Clears self._kdtree so nearestWellPoint rebuilds it on demand
+
+        Notes:
+            - Must be called whenever self.currently_used_lines is reassigned
+            - An empty mapping is stored when no wells are displayed
+        """
+        if self.currently_used_lines is None or self.currently_used_lines.empty:
+            self._lines_by_api: Dict[str, np.ndarray] = {}
+            self._wells_x: np.ndarray = np.empty(0, dtype=np.float32)
+            self._wells_y: np.ndarray = np.empty(0, dtype=np.float32)
+            self._wells_origin: Tuple[float, float] = (0.0, 0.0)
+            self._wells_api: np.ndarray = np.empty(0, dtype=object)
+            self._kdtree: Optional[cKDTree] = None
+            return
+
+        self._lines_by_api = {
+            api: group[['X', 'Y', 'SPX', 'SPY', 'Targeted Elevation']].to_numpy(dtype=np.float64)
+            for api, group in self.currently_used_lines.groupby('APINumber', sort=False)}
+
+        # Flat per-point arrays for click lookups; the KD-tree is rebuilt lazily from them.
+        # Stored as float32 offsets from the lower-left point: UTM coordinates lose ~0.5 m in
+        # raw float32, but offsets within the displayed area keep millimetre precision
+        x: np.ndarray = self.currently_used_lines['X'].to_numpy(dtype=np.float64)
+        y: np.ndarray = self.currently_used_lines['Y'].to_numpy(dtype=np.float64)
+        self._wells_origin: Tuple[float, float] = (float(x.min()), float(y.min()))
+        self._wells_x = (x - self._wells_origin[0]).astype(np.float32)
+        self._wells_y = (y - self._wells_origin[1]).astype(np.float32)
+        self._wells_api = self.currently_used_lines['APINumber'].to_numpy()
+        self._kdtree = None
+
+    def nearestWellPoint(self, x: float, y: float, limit: float) -> int:
+        """
+        Finds the displayed well point nearest to (x, y) within a distance limit.
+
+        Args:
+            x: Query x coordinate (map units)
+            y: Query y coordinate (map units)
+            limit: Maximum accepted distance
+
+        Returns:
+            int: Index into self._wells_x/_wells_y/_wells_api, or -1 if no point
+                lies within the limit
+
+        Notes:
+            - With numba, every set is scanned in one compiled pass (nearestWithin)
+            - Without numba, small sets use the numpy scan and sets of
+              KDTREE_MIN_POINTS or more use a KD-tree built on first use after each
+              indexCurrentlyUsedLines call
+        """
+        if self._wells_x.size == 0:
+            return -1
+
+        # Move the query into the same local frame as the float32 point offsets
+        x = x - self._wells_origin[0]
+        y = y - self._wells_origin[1]
+
+        if not NUMBA_AVAILABLE and self._wells_x.size >= KDTREE_MIN_POINTS:
+            if self._kdtree is None:
+                self._kdtree = cKDTree(np.column_stack((self._wells_x, self._wells_y)))
+            # The bounded query reports a miss as index == n, so no distance test is needed
+            _, point_index = self._kdtree.query([x, y], k=1, distance_upper_bound=limit)
+            return int(point_index) if point_index < self._wells_x.size else -1
+
+        # Compare squared distances against the squared limit
+        return int(nearestWithin(self._wells_x, self._wells_y, float(x), float(y), float(limit * limit)))
+
     def returnSegmentsFromDF(self, df: pd.DataFrame) -> List[List[List[float]]]:
         """
         Converts well coordinate data from a DataFrame into nested segment lists.
@@ -4134,8 +4702,36 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                 [[200.5, 600.5], [201.5, 601.5]]   # Well 2
             ]
         """
-        return [[[float(x), float(y)] for x, y in zip(group['X'], group['Y'])]
-                for _, group in df.groupby('APINumber')]
+        coords, offsets = self.returnSegmentArraysFromDF(df)
+        return [coords[offsets[k]:offsets[k + 1]].tolist() for k in range(len(offsets) - 1)]
+
+    def returnSegmentArraysFromDF(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts well coordinate data into one flat coordinate array plus per-well offsets.
+
+        Array form of returnSegmentsFromDF: rows are stably ordered by APINumber
+        (same well order and point order as the groupby version) and the X/Y
+        columns are cast to float64 once for the whole frame.
+
+        Args:
+            df: pd.DataFrame containing APINumber, X and Y columns
+
+        Returns:
+            Tuple containing:
+                - np.ndarray: (N, 2) float64 array of x/y points for all wells
+                - np.ndarray: Start index of each well in the array followed by N
+
+        Example:
+            >>> coords, offsets = self.returnSegmentArraysFromDF(self.df_docket_data)
+            >>> first_well = coords[offsets[0]:offsets[1]]
+        """
+        codes, _ = pd.factorize(df['APINumber'], sort=True)
+        order: np.ndarray = np.argsort(codes, kind='stable')
+        coords: np.ndarray = df[['X', 'Y']].to_numpy(dtype=np.float64)[order]
+        sizes: np.ndarray = np.bincount(codes[codes >= 0])
+        offsets: np.ndarray = np.concatenate(([0], sizes.cumsum()))
+        # Rows without an APINumber (code -1) sort first; skip them as groupby would
+        return coords[len(codes) - offsets[-1]:], offsets
 
     def drawModelBasedOnParameters2d(
             self,
@@ -4917,9 +5513,11 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         # Add color coding
         final_df['WellTypeColor'] = final_df['CurrentWellType'].map(colors_type)
-        final_df['WellStatusColor'] = final_df['CurrentWellStatus'].apply(
-            lambda x: colors_status.get(x, '#4a7583')
-        )
+        # Status colors are resolved once per category and gathered by code instead of per-row apply
+        status_cat = final_df['CurrentWellStatus'].cat
+        status_color_lut: np.ndarray = np.array(
+            [colors_status.get(c, '#4a7583') for c in status_cat.categories] + ['#4a7583'], dtype=object)
+        final_df['WellStatusColor'] = status_color_lut[status_cat.codes.to_numpy()]
 
         return final_df.sort_values(by=['APINumber', 'MeasuredDepth'])
 
@@ -4953,56 +5551,6 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                 ['1 23S 2W B', '2 23S 2W B', ...]        # Transformed section labels
             )
         """
-        def transformString(s: str) -> str:
-            """
-            Transforms a well location string from compact format to readable format.
-
-            Converts strings like '01235S02WB' to formatted strings like '1 23S 2W B'
-            by removing leading zeros and adding spaces between components. Used for
-            standardizing location representations in well data visualization.
-
-            Format components:
-                - First 2 digits: Section number
-                - Next 2 digits + 'S': Township number with direction
-                - Next 2 digits + 'W': Range number with direction
-                - Last character: Baseline identifier
-
-            Args:
-                s: Input string in format 'SSTTDRRDB' where:
-                   SS = Section (2 digits)
-                   TT = Township (2 digits)
-                   D = Direction (S)
-                   RR = Range (2 digits)
-                   D = Direction (W)
-                   B = Baseline identifier
-
-            Returns:
-                Formatted string with components separated by spaces and leading zeros removed.
-                Returns original string if it doesn't match the expected pattern.
-
-            Examples:
-                >>> transformString('01235S02WB')
-                '1 23S 2W B'
-                >>> transformString('12345S67WN')
-                '12 34S 67W N'
-                >>> transformString('invalid')
-                'invalid'
-            """
-
-            # Parse string using regex pattern for well location format
-            parts = re.match(r'(\d{2})(\d{2}S)(\d{2}W)([A-Z])', s)
-            if not parts:
-                return s  # Return unchanged if pattern doesn't match
-
-            # Extract and format components, removing leading zeros
-            part1 = str(int(parts.group(1)))  # Section number
-            part2 = str(int(parts.group(2)[:-1])) + parts.group(2)[-1]  # Township
-            part3 = str(int(parts.group(3)[:-1])) + parts.group(3)[-1]  # Range
-            part4 = parts.group(4)  # Baseline
-
-            # Return formatted string with proper spacing
-            return f"{part1} {part2} {part3} {part4}"
-
         # generate a list of data of the plat, with its xy and ID values
         # Extract coordinate and concession data
         plat_data = self.df_plat[['Easting', 'Northing', 'Conc']].values.tolist()
@@ -5354,7 +5902,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
     def loadPlatData(self) -> None:
         """
         Loads and processes plat (land survey) data from database, converting geographic
-        coordinates to UTM projection and creating geometry objects.
+        coordinates to UTM projection.
 
         Loads plat and adjacent plat data from database tables, removes duplicates and
         invalid coordinates, then transforms coordinates from Lat/Lon to UTM projection
@@ -5367,19 +5915,18 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                     - Lon: float - Longitude coordinates
                     - Easting: float - UTM easting coordinate
                     - Northing: float - UTM northing coordinate
-                    - geometry: Point - Shapely Point geometry
                 self.df_adjacent_plats: Adjacent plat reference data
+            - Rebuilds self._adjacent_by_board / self._plat_by_board (Board_Docket ->
+              row positions), clears self._plat_cache and marks the drawn plats dirty
 
         Notes:
             - Requires active database connection in self.conn_db
             - Removes rows with null Lat/Lon values
             - Converts geographic coordinates to UTM projection
-            - Creates Shapely Point geometries for spatial operations
             - Database must contain tables: PlatData, Adjacent
 
         Dependencies:
             - utm package for coordinate transformation
-            - shapely.geometry for spatial objects
         """
         # Load raw plat data from database
         self.df_plat = read_sql('select * from PlatData', self.conn_db)
@@ -5397,11 +5944,14 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             )
         )
 
-        # Create Shapely Point geometries for spatial analysis
-        self.df_plat['geometry'] = self.df_plat.apply(
-            lambda row: Point(row['Easting'], row['Northing']),
-            axis=1
-        )
+        # Row positions per board so drawTSRPlat avoids full Board_Docket scans
+        self._adjacent_by_board: Dict[str, np.ndarray] = self.df_adjacent_plats.groupby(
+            'Board_Docket', sort=False).indices
+        self._plat_by_board: Dict[str, np.ndarray] = self.df_plat.groupby('Board_Docket', sort=False).indices
+
+        # Plat geometry cached by drawTSRPlat is stale once the source data is reloaded
+        self._plat_cache.clear()
+        self._plat_data_dirty = True
 
     def loadDfFields(self) -> None:
         """
@@ -5413,11 +5963,12 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         Side Effects:
             - Creates/Updates following attributes:
-                self.df_field: Enhanced with geometry column
+                self.df_field_indexed: Field vertices indexed by Field_Name
                 self.df_adjacent_fields: DataFrame containing adjacent field relationships
                     Columns:
                     - Field_Name: str - Name of the reference field
                     - adjacent_Field_Name: str - Name of the neighboring field
+            - Clears the colorInFields2 result cache (self._last_fields_key / self._fields_cache)
 
         Notes:
             - Requires self.df_field to contain:
@@ -5425,11 +5976,9 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
                 - Easting: float - UTM easting coordinate
                 - Northing: float - UTM northing coordinate
             - Uses 10-unit buffer for intersection detection
-            - Creates point geometries for individual locations
             - Generates polygons for field boundaries
 
         Implementation Details:
-            - Creates point geometries from coordinates
             - Groups coordinates by field to create field polygons
             - Uses spatial buffer of 10 units to detect field intersections
             - Identifies and stores all adjacent field relationships
@@ -5437,12 +5986,6 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Initialize storage for adjacent field relationships
         adjacent_fields: List[Dict[str, str]] = []
 
-        # Create point geometries for field locations
-        self.df_field['geometry'] = self.df_field.apply(
-            lambda row: Point(row['Easting'], row['Northing']),
-            axis=1
-        )
-
         # Extract relevant fields for polygon creation
         used_fields = self.df_field[['Field_Name', 'Easting', 'Northing']]
 
@@ -5457,21 +6000,34 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         gdf = gpd.GeoDataFrame(polygons, geometry='geometry')
         gdf['buffer'] = gdf['geometry'].buffer(10)
 
-        # Identify adjacent fields using spatial analysis
-        for _, row in gdf.iterrows():
+        # Identify adjacent fields using spatial analysis, iterating plain arrays instead of iterrows
+        for field_name, geom in zip(gdf['Field_Name'].to_numpy(), gdf['geometry'].to_numpy()):
             # Find neighboring fields using buffer intersection
-            neighbors = gdf[gdf['buffer'].intersects(row['geometry'])]['Field_Name'].tolist()
-            neighbors.remove(row['Field_Name'])  # Remove self-reference
+            neighbors = gdf.loc[gdf['buffer'].intersects(geom), 'Field_Name'].tolist()
+            neighbors.remove(field_name)  # Remove self-reference
 
             # Create adjacency relationships
             adjacent_fields.extend([
-                {'Field_Name': row['Field_Name'], 'adjacent_Field_Name': neighbor}
+                {'Field_Name': field_name, 'adjacent_Field_Name': neighbor}
                 for neighbor in neighbors
             ])
 
         # Convert adjacency list to DataFrame
         self.df_adjacent_fields = pd.DataFrame(adjacent_fields)
 
+        # Field geometry cached by colorInFields2 is stale once the fields are reloaded
+        self._last_fields_key = None
+        self._fields_cache = None
+
+        # Index field vertices by name once (stable sort keeps each field's vertex order)
+        self.df_field_indexed: DataFrame = self.df_field[['Field_Name', 'Easting', 'Northing']].set_index(
+            'Field_Name').sort_index(kind='mergesort')
+
+        # Map each field to its adjacent fields once so per-docket lookups skip the isin scans
+        self._adjacency_map: Dict[str, List[str]] = {}
+        for adjacency in adjacent_fields:
+            self._adjacency_map.setdefault(adjacency['Field_Name'], []).append(adjacency['adjacent_Field_Name'])
+
     def loadBoardData(self) -> None:
         """
         Loads board data and links from database, adding concatenated location codes.
@@ -5538,6 +6094,7 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
 
         Side Effects:
             - Creates/Updates self.dx_data with processed well information
+            - Creates self._dx_data_by_ymd: (Board_Year, Docket_Month, Board_Docket) -> row positions
 
         Notes:
             - Filters out plugged wells (WorkType = 'PLUG')
@@ -5596,6 +6153,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         condition = pd.isna(self.dx_data['WellAge']) & (self.dx_data['CurrentWellStatus'] == 'Approved Permit')
         self.dx_data.loc[condition, 'WellAge'] = 0
 
+        # Store status and type as categoricals so the docket counters can bincount integer codes
+        self.dx_data['CurrentWellStatus'] = self.dx_data['CurrentWellStatus'].astype('category')
+        self.dx_data['CurrentWellType'] = self.dx_data['CurrentWellType'].astype('category')
+
         # Sort by month and year
         self.dx_data['month_order'] = self.dx_data['Docket_Month'].map(month_dict)
         df_sorted = self.dx_data.sort_values(by=['Board_Year', 'month_order'])
@@ -5604,6 +6165,10 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Standardize field names
         self.dx_data['FieldName'] = self.dx_data['FieldName'].map(translated_fields)
 
+        # Cache row positions per (year, month, docket) for the per-selection well lookups
+        self._dx_data_by_ymd: Dict[Tuple[str, str, str], np.ndarray] = self.dx_data.groupby(
+            ['Board_Year', 'Docket_Month', 'Board_Docket'], sort=False).indices
+
         # Return unique wells only
         dx_data_unique = self.dx_data.drop_duplicates(subset=['WellID'])
         return dx_data_unique
@@ -5632,8 +6197,9 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         Side Effects:
             - Modifies self.dx_df: Main directional survey DataFrame
             - Creates self.df_shl: Surface hole location DataFrame
+            - Creates self._dx_df_groups: APINumber -> row positions in self.dx_df
         """
-        # Load directional survey data and remove duplicates
+        # Load directional survey data and remove duplicates once; per-well lookups rely on this
         self.dx_df = read_sql('select * from DX', self.conn_db)
         self.dx_df.drop_duplicates(keep='first', inplace=True)
 
@@ -5646,13 +6212,13 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
             right_on='WellID'
         )
 
-        # Convert coordinate columns to float type
-        self.dx_df['X'] = self.dx_df['X'].astype(float)
-        self.dx_df['Y'] = self.dx_df['Y'].astype(float)
+        # Convert coordinate and depth columns to float64 once so per-well extraction is copy-free
+        self.dx_df['X'] = self.dx_df['X'].astype(np.float64)
+        self.dx_df['Y'] = self.dx_df['Y'].astype(np.float64)
+        self.dx_df['TrueVerticalDepth'] = to_numeric(self.dx_df['TrueVerticalDepth'], errors='coerce').astype(np.float64)
 
         # Calculate true elevation relative to well head elevation
-        self.dx_df['TrueElevation'] = self.dx_df['Elevation'] - to_numeric(self.dx_df['TrueVerticalDepth'],
-                                                                           errors='coerce')
+        self.dx_df['TrueElevation'] = (self.dx_df['Elevation'] - self.dx_df['TrueVerticalDepth']).astype(np.float64)
         self.dx_df['MeasuredDepth'] = to_numeric(self.dx_df['MeasuredDepth'], errors='coerce')
 
         # Standardize citing type to lowercase
@@ -5663,8 +6229,8 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         self.dx_df.loc[self.dx_df['CitingType'] == 'vertical', 'Y'] += self.dx_df.groupby(['X', 'Y']).cumcount() * 1e-3
 
         # Convert coordinates to state plane (meters to feet)
-        self.dx_df['SPX'] = self.dx_df['X'].astype(float) / 0.3048  # Convert meters to feet
-        self.dx_df['SPY'] = self.dx_df['Y'].astype(float) / 0.3048  # Convert meters to feet
+        self.dx_df['SPX'] = self.dx_df['X'] / 0.3048  # Convert meters to feet
+        self.dx_df['SPY'] = self.dx_df['Y'] / 0.3048  # Convert meters to feet
 
         # Sort data by well ID and measured depth
         self.dx_df = self.dx_df.sort_values(by=['WellID', 'MeasuredDepth'])
@@ -5672,6 +6238,11 @@ class wellVisualizationProcess(QMainWindow, BoardMattersVisualizer):
         # Create surface hole location DataFrame from first point of each well
         self.df_shl = self.dx_df.groupby('WellID').first().reset_index()
 
+        # Cache the row positions of each well so single-well lookups avoid a full-column scan
+        self._dx_df_groups: Dict[str, np.ndarray] = self.dx_df.groupby('APINumber', sort=False).indices
+        self._last_drawn_well = None
+        self._last_targeted_elevation = None
+
     def reTranslateData(self, i):
         conc_code_merged = i[:6]
         conc_code_merged.iloc[2] = self.translateNumberToDirection('township', str(conc_code_merged.iloc[2])).upper()